@@ -4,38 +4,38 @@ Live MCP Demo - Shows how jump codes could call real MCP tools
 This demonstrates the connection between jump codes and Claude Desktop MCP tools
 """
 
+import sys
+from types import MappingProxyType
 from typing import Dict, Any
 import json
 
+# These are the actual MCP tools I can use in this session.
+# Built once at import time; the demo (and anything importing it) just reads.
+MCP_TOOLS = MappingProxyType({
+    "filesystem": ["readFile", "writeFile", "listDirectory"],
+    "command-runner": ["execute"],
+    "desktop-commander": ["read_file", "write_file", "execute_command"],
+    "wcgw": ["BashCommand", "ReadFiles", "FileWriteOrEdit"],
+    "github": ["create_repository", "push_files", "create_pull_request"],
+    "rag-web-browser": ["browse"],
+    "Neon-Local": ["run_sql", "create_project"],
+})
+
 def demo_mcp_integration():
     """
     This function shows how your jump codes COULD connect to MCP tools
     if they were integrated. Right now they're separate systems.
     """
-    
-    print("="*60)
-    print("MCP Tools Available in Claude Desktop:")
-    print("="*60)
-    
-    # These are the actual MCP tools I can use in this session
-    mcp_tools = {
-        "filesystem": ["readFile", "writeFile", "listDirectory"],
-        "command-runner": ["execute"],
-        "desktop-commander": ["read_file", "write_file", "execute_command"],
-        "wcgw": ["BashCommand", "ReadFiles", "FileWriteOrEdit"],
-        "github": ["create_repository", "push_files", "create_pull_request"],
-        "rag-web-browser": ["browse"],
-        "Neon-Local": ["run_sql", "create_project"],
-    }
-    
-    for tool_category, functions in mcp_tools.items():
-        print(f"\n{tool_category}:")
-        for func in functions:
-            print(f"  - {func}")
-    
-    print("\n" + "="*60)
-    print("How to Connect Jump Codes to MCP:")
-    print("="*60)
+
+    # One buffered write instead of ~30 small prints fighting over stdio
+    lines = ["="*60, "MCP Tools Available in Claude Desktop:", "="*60]
+    for tool_category, functions in MCP_TOOLS.items():
+        lines.append(f"\n{tool_category}:")
+        lines.extend(f"  - {func}" for func in functions)
+
+    lines.extend(["\n" + "="*60, "How to Connect Jump Codes to MCP:", "="*60])
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     
     example_mapping = """
     # In agent_squad_jump_integration.py, add:
@@ -3,10 +3,43 @@ MCP (Model Context Protocol) Integration Bridge
 Connects Jump Codes to Claude Desktop MCP Tools
 """
 
+import os
 import json
+import zlib
 from typing import Dict, Any, List
 import asyncio
 
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+MCP_WS_URL = os.getenv("MCP_WS_URL", "ws://localhost:8765")
+
+# Optional JIT boost: numba compiles the byte-level transform paths when
+# available; otherwise we fall back to zlib's C implementation
+try:
+    import numba
+    import numpy as np
+
+    @numba.njit(cache=True, nogil=True)
+    def _checksum_bytes(buf):
+        """Simple rolling checksum over a uint8 buffer (nogil, JIT-compiled)"""
+        total = numba.uint32(0)
+        for i in range(buf.shape[0]):
+            total = (total * numba.uint32(31) + numba.uint32(buf[i])) & numba.uint32(0xFFFFFFFF)
+        return total
+
+    def content_checksum(content: bytes) -> int:
+        return int(_checksum_bytes(np.frombuffer(content, dtype=np.uint8)))
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    def content_checksum(content: bytes) -> int:
+        return zlib.crc32(content) & 0xFFFFFFFF
+
+    NUMBA_AVAILABLE = False
+
 class MCPToolBridge:
     """Bridge between Jump Codes and MCP Tools"""
     
@@ -17,7 +50,67 @@ class MCPToolBridge:
             'web_search': ['search'],
             'rag-web-browser': ['browse']
         }
-        
+        # O(1) tool dispatch instead of a growing if/elif chain
+        self._dispatch = {
+            "filesystem.readFile": self._do_read,
+            "filesystem.writeFile": self._do_write,
+            "command-runner.execute": self._do_exec,
+            "web_search": self._do_search,
+        }
+        # Warm the JIT cache so the first real call doesn't pay compile cost
+        if NUMBA_AVAILABLE:
+            content_checksum(b"warmup")
+
+        # Persistent connection state: one WebSocket shared by all calls,
+        # with a writer queue and a reader that demuxes replies by id
+        self._ws = None
+        self._send_queue = None
+        self._writer_task = None
+        self._reader_task = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+
+    async def _ensure_connection(self):
+        """Open the persistent WebSocket once and reuse it for every call"""
+        if self._ws is not None:
+            return self._ws
+        if websockets is None:
+            raise RuntimeError(
+                "websockets library required. Install with: pip install websockets"
+            )
+
+        self._ws = await websockets.connect(MCP_WS_URL)
+        self._send_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer())
+        self._reader_task = asyncio.create_task(self._reader())
+        return self._ws
+
+    async def _writer(self):
+        """Drain the send queue onto the shared socket"""
+        while True:
+            payload = await self._send_queue.get()
+            await self._ws.send(payload)
+
+    async def _reader(self):
+        """Demux incoming frames to the futures awaiting them"""
+        async for message in self._ws:
+            frame = json.loads(message)
+            future = self._pending.pop(frame.get("id"), None)
+            if future and not future.done():
+                future.set_result(frame.get("result", frame))
+
+    async def close(self):
+        """Tear down the persistent connection, if one was opened"""
+        for task in (self._writer_task, self._reader_task):
+            if task:
+                task.cancel()
+        if self._ws is not None:
+            await self._ws.close()
+        self._ws = None
+        self._send_queue = None
+        self._writer_task = None
+        self._reader_task = None
+
     async def call_mcp_tool(self, tool_name: str, params: Dict[str, Any]) -> Any:
         """
         Call an MCP tool through Claude Desktop
@@ -27,22 +120,44 @@ class MCPToolBridge:
         2. Send the tool request
         3. Return the result
         """
+        # Use the live MCP connection when one is open: enqueue the request
+        # and await the demuxed reply instead of opening a socket per call
+        if self._ws is not None:
+            self._next_id += 1
+            req_id = self._next_id
+            future = asyncio.get_running_loop().create_future()
+            self._pending[req_id] = future
+            self._send_queue.put_nowait(json.dumps({
+                "id": req_id,
+                "jsonrpc": "2.0",
+                "method": tool_name,
+                "params": params
+            }))
+            return await future
+
         # This is a placeholder - actual implementation would connect to MCP
         print(f"MCP Tool Call: {tool_name}")
         print(f"Parameters: {params}")
-        
+
         # Simulate tool responses
-        if tool_name == "filesystem.readFile":
-            return {"content": "File content would be here"}
-        elif tool_name == "filesystem.writeFile":
-            return {"success": True, "path": params.get('path')}
-        elif tool_name == "command-runner.execute":
-            return {"output": "Command output", "exitCode": 0}
-        elif tool_name == "web_search":
-            return {"results": ["Search result 1", "Search result 2"]}
-        
-        return {"error": "Tool not implemented"}
-    
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
+            return {"error": "Tool not implemented"}
+        return await handler(params)
+
+    # Simulated per-tool responses
+    async def _do_read(self, params: Dict[str, Any]) -> Any:
+        return {"content": "File content would be here"}
+
+    async def _do_write(self, params: Dict[str, Any]) -> Any:
+        return {"success": True, "path": params.get('path')}
+
+    async def _do_exec(self, params: Dict[str, Any]) -> Any:
+        return {"output": "Command output", "exitCode": 0}
+
+    async def _do_search(self, params: Dict[str, Any]) -> Any:
+        return {"results": ["Search result 1", "Search result 2"]}
+
     def register_with_jump_codes(self, jump_registry):
         """Register MCP tools as jump codes"""
         from jump_codes import JumpCode
@@ -75,10 +190,12 @@ class MCPToolBridge:
     async def _read_file_handler(self, context: Dict[str, Any], path: str, **kwargs):
         """Handler for read_file jump code"""
         result = await self.call_mcp_tool("filesystem.readFile", {"path": path})
+        content = result.get('content', 'Error reading file')
         return {
             'type': 'file_read',
             'path': path,
-            'content': result.get('content', 'Error reading file')
+            'content': content,
+            'checksum': content_checksum(content.encode())
         }
     
     async def _write_file_handler(self, context: Dict[str, Any], path: str, content: str, **kwargs):
@@ -7,7 +7,9 @@ Tests the real WebSocket connection to Claude Desktop MCP tools
 import asyncio
 import json
 import logging
+from collections import Counter
 from datetime import datetime
+from time import perf_counter_ns
 import sys
 import os
 
@@ -23,6 +25,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_STATUS_SYMBOLS = {
+    'PASSED': '✅',
+    'FAILED': '❌',
+    'WARNING': '⚠️'
+}
+
 class MCPIntegrationTester:
     """Comprehensive test suite for MCP bridge"""
     
@@ -143,26 +151,27 @@ class MCPIntegrationTester:
         
         try:
             # First read (should hit MCP)
-            start_time = asyncio.get_event_loop().time()
+            t0 = perf_counter_ns()
             result1 = await self.bridge.call_mcp_tool("filesystem.readFile", {
                 "path": test_path
             })
-            first_call_time = asyncio.get_event_loop().time() - start_time
-            
+            first_call_ns = perf_counter_ns() - t0
+
             # Second read (should hit cache)
-            start_time = asyncio.get_event_loop().time()
+            t0 = perf_counter_ns()
             result2 = await self.bridge.call_mcp_tool("filesystem.readFile", {
                 "path": test_path
             })
-            second_call_time = asyncio.get_event_loop().time() - start_time
-            
-            if result1 == result2 and second_call_time < first_call_time * 0.5:
+            second_call_ns = perf_counter_ns() - t0
+
+            # Integer ns comparison avoids float rounding on sub-µs hits
+            if result1 == result2 and second_call_ns * 2 < first_call_ns:
                 self.results.append({
                     'test': test_name,
                     'status': 'PASSED',
                     'message': 'Cache working correctly',
-                    'first_call_ms': round(first_call_time * 1000, 2),
-                    'cached_call_ms': round(second_call_time * 1000, 2)
+                    'first_call_us': round(first_call_ns / 1_000, 2),
+                    'cached_call_us': round(second_call_ns / 1_000, 2)
                 })
             else:
                 self.results.append({
@@ -213,36 +222,38 @@ class MCPIntegrationTester:
             
     def print_results(self):
         """Print test results summary"""
-        print("\n" + "="*60)
-        print("MCP BRIDGE INTEGRATION TEST RESULTS")
-        print("="*60 + "\n")
-        
-        passed = sum(1 for r in self.results if r['status'] == 'PASSED')
-        failed = sum(1 for r in self.results if r['status'] == 'FAILED')
-        warnings = sum(1 for r in self.results if r['status'] == 'WARNING')
-        
+        # Single pass over results instead of one scan per status
+        counts = Counter(r['status'] for r in self.results)
+        passed = counts['PASSED']
+        failed = counts['FAILED']
+        warnings = counts['WARNING']
+
+        lines = ["", "="*60, "MCP BRIDGE INTEGRATION TEST RESULTS", "="*60, ""]
+
         for result in self.results:
-            status_symbol = {
-                'PASSED': '✅',
-                'FAILED': '❌',
-                'WARNING': '⚠️'
-            }.get(result['status'], '❓')
-            
-            print(f"{status_symbol} {result['test']}: {result['status']}")
+            status_symbol = _STATUS_SYMBOLS.get(result['status'], '❓')
+
+            lines.append(f"{status_symbol} {result['test']}: {result['status']}")
             if 'message' in result:
-                print(f"   {result['message']}")
+                lines.append(f"   {result['message']}")
             if 'error' in result:
-                print(f"   Error: {result['error']}")
+                lines.append(f"   Error: {result['error']}")
             if result['status'] == 'PASSED' and 'output' in result:
-                print(f"   Output: {result['output']}")
-            print()
-            
-        print("\n" + "-"*60)
-        print(f"Total Tests: {len(self.results)}")
-        print(f"Passed: {passed} | Failed: {failed} | Warnings: {warnings}")
-        print(f"Success Rate: {(passed/len(self.results)*100):.1f}%")
-        print("-"*60 + "\n")
-        
+                lines.append(f"   Output: {result['output']}")
+            lines.append("")
+
+        lines.extend([
+            "",
+            "-"*60,
+            f"Total Tests: {len(self.results)}",
+            f"Passed: {passed} | Failed: {failed} | Warnings: {warnings}",
+            f"Success Rate: {(passed/len(self.results)*100):.1f}%",
+            "-"*60 + "\n"
+        ])
+        # One buffered write instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
         return failed == 0
         
     async def run_all_tests(self):
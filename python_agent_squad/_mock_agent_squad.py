@@ -0,0 +1,33 @@
+# _mock_agent_squad.py
+"""Mock Agent/Task/Crew used when neither agent-squad nor crewai is installed.
+
+Kept in its own module so a successful agent_squad (or crewai) import
+never compiles or executes these class bodies.
+"""
+
+
+class Agent:
+    def __init__(self, role, goal, backstory, tools=None, verbose=True, allow_delegation=False):
+        self.role = role
+        self.goal = goal
+        self.backstory = backstory
+        self.tools = tools or []
+        self.verbose = verbose
+
+
+class Task:
+    def __init__(self, description, agent, expected_output):
+        self.description = description
+        self.agent = agent
+        self.expected_output = expected_output
+
+
+class Crew:
+    def __init__(self, agents, tasks, verbose=True, process="sequential"):
+        self.agents = agents
+        self.tasks = tasks
+        self.verbose = verbose
+        self.process = process
+
+    def kickoff(self):
+        return "Mock execution completed"
@@ -1,139 +1,436 @@
 # advanced_jump_codes.py
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import Callable, List, Dict, Any, Optional
+from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from itertools import islice
 from jump_codes import JumpCodeRegistry
 import re
 import json
+import time
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Matches ${param_name} placeholders; compiled once so macro definition and
+# expansion never pay regex-cache lookups per code
+_PARAM_RE = re.compile(r'\$\{(\w+)\}')
+
+# Context keys a handler result must never overwrite
+_PROTECTED_KEYS = frozenset({'sequence_id', 'sequence_position', 'previous_results'})
+
+# Critical errors that abort a running sequence, compiled into a single
+# alternation so matching is one linear scan over the error message
+_CRITICAL_RE = re.compile('|'.join(re.escape(s) for s in (
+    "Missing required context",
+    "Unknown jump code",
+    "Invalid jump code format",
+)))
+
+# Input-classification patterns, compiled once instead of per process_input call
+_MACRO_CALL_RE = re.compile(r'!(\w+)\(([^)]*)\)')
+_SEQ_RE = re.compile(r'@@(\S+)')
+_INLINE_RE = re.compile(r'\{@([^}]+)\}')
+_PARAM_KV_RE = re.compile(r'(\w+)\s*=\s*([^,]+)')
+
+# Params that reference earlier outputs (named agents, checkpoints) pin a
+# code to its own serial stage in batched execution
+_STAGE_BREAK_RE = re.compile(r'agent=agent_\d+|name=checkpoint_')
+
+@dataclass(slots=True)
+class SequenceResult:
+    """One executed code in a sequence.
+
+    Slots keep the objects a fraction of the size of the equivalent dicts,
+    which matters once sequence memory holds hundreds of them. Dict-style
+    access is kept so existing callers and handlers keep working.
+    """
+    code: str = ''
+    success: bool = False
+    result: Any = None
+    error: str = ''
+    position: int = 0
+    timestamp_ns: int = 0
+    timestamp: str = ''
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Project to the historical dict shape for serialization"""
+        d = {'code': self.code, 'success': self.success,
+             'position': self.position, 'timestamp': self.timestamp}
+        if self.success:
+            d['result'] = self.result
+        else:
+            d['error'] = self.error
+        return d
+
+
+@dataclass(slots=True)
+class SequenceRecord:
+    """A completed sequence run held in sequence memory"""
+    sequence: List[str]
+    results: List[SequenceResult]
+    timestamp: datetime
+    duration: float
+    completed: bool
+    success_count: int
+    success_rate: float
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+class _SequenceResults(list):
+    """Per-code results with the success tally carried alongside.
+
+    Behaves exactly like the list execute_sequence has always returned,
+    but callers read `success_count` instead of re-walking the results.
+    """
+
+    success_count: int = 0
+
+
+class _ReadOnlyListView:
+    """Read-only view over a live results list.
+
+    Handlers see every result appended so far without execute_sequence
+    having to copy the list each iteration.
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items: List[Any]):
+        self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __repr__(self):
+        return f"_ReadOnlyListView({self._items!r})"
+
+
 class SequentialJumpCodes:
     """Handle sequential execution of jump codes with shared context"""
     
     def __init__(self, registry: JumpCodeRegistry):
         self.registry = registry
-        self.sequence_memory: List[Dict[str, Any]] = []
         self.max_memory_size = 100  # Keep last 100 sequences
+        # Bounded deque evicts the oldest record on append instead of
+        # rebuilding the list on every overflow
+        self.sequence_memory: deque = deque(maxlen=self.max_memory_size)
     
-    def execute_sequence(self, sequence: List[str]) -> List[Dict[str, Any]]:
-        """Execute a sequence of jump codes with shared context"""
+    def execute_sequence(self, sequence: List[str],
+                         parallel: bool = False) -> List[SequenceResult]:
+        """Execute a sequence of jump codes with shared context.
+
+        With parallel=True the codes are treated as independent: each runs
+        on a thread pool with its own context snapshot, and results keep
+        their input positions. Use only for sequences whose handlers don't
+        depend on each other's context updates.
+        """
+        wall_start = datetime.now()
         shared_context = {
-            'sequence_id': datetime.now().strftime('%Y%m%d_%H%M%S_%f'),
-            'sequence_start': datetime.now()
+            'sequence_id': wall_start.strftime('%Y%m%d_%H%M%S_%f'),
+            'sequence_start': wall_start
         }
-        results = []
-        
+        results = _SequenceResults()
+        success_count = 0
+
         logger.info(f"Starting sequence execution with {len(sequence)} codes")
-        
+
+        # One monotonic read per result instead of a datetime allocation plus
+        # isoformat per iteration; ISO strings are materialized after the loop
+        t0_ns = time.monotonic_ns()
+
+        if parallel and len(sequence) > 1:
+            success_count = self._run_parallel(sequence, shared_context, results)
+            return self._finish_sequence(sequence, results, success_count,
+                                         wall_start, t0_ns)
+
+        # Single live view instead of an O(i) list copy per iteration
+        shared_context['previous_results'] = _ReadOnlyListView(results)
+
+        # Pool of result objects allocated in one batch; each iteration fills
+        # its slot in place instead of building a fresh one. The pool is per
+        # call only — sequence_memory keeps references to these objects.
+        pool = [SequenceResult() for _ in range(len(sequence))]
+
         for i, code in enumerate(sequence):
             # Add sequence position to context
             shared_context['sequence_position'] = i
-            shared_context['previous_results'] = results.copy()
-            
+            r = pool[i]
+            r.code = code
+            r.position = i
+
             try:
                 logger.debug(f"Executing code {i+1}/{len(sequence)}: {code}")
                 result = self.registry.execute(code, shared_context)
-                
-                results.append({
-                    'code': code,
-                    'success': True,
-                    'result': result,
-                    'position': i,
-                    'timestamp': datetime.now().isoformat()
-                })
-                
-                # Update shared context with result if it's a dict
+
+                r.success = True
+                r.result = result
+                r.timestamp_ns = time.monotonic_ns()
+                results.append(r)
+                success_count += 1
+
+                # Update shared context with result if it's a dict; one bulk
+                # C-level update instead of a Python loop with per-key checks
                 if isinstance(result, dict):
-                    # Avoid overwriting critical keys
-                    protected_keys = {'sequence_id', 'sequence_position', 'previous_results'}
-                    for key, value in result.items():
-                        if key not in protected_keys:
-                            shared_context[key] = value
+                    shared_context.update(
+                        {k: v for k, v in result.items() if k not in _PROTECTED_KEYS}
+                    )
                 
             except Exception as e:
                 logger.error(f"Error executing code at position {i}: {e}")
-                results.append({
-                    'code': code,
-                    'success': False,
-                    'error': str(e),
-                    'position': i,
-                    'timestamp': datetime.now().isoformat()
-                })
+                r.success = False
+                r.error = str(e)
+                r.timestamp_ns = time.monotonic_ns()
+                results.append(r)
                 
                 # Decide whether to continue or abort
                 if self._should_abort_sequence(e, i, len(sequence)):
                     logger.warning("Aborting sequence due to critical error")
                     break
         
-        # Record sequence in memory
-        sequence_record = {
-            'sequence': sequence,
-            'results': results,
-            'timestamp': datetime.now(),
-            'duration': (datetime.now() - shared_context['sequence_start']).total_seconds(),
-            'completed': len(results) == len(sequence),
-            'success_rate': sum(1 for r in results if r['success']) / len(results) if results else 0
+        return self._finish_sequence(sequence, results, success_count,
+                                     wall_start, t0_ns)
+
+    def _run_parallel(self, sequence: List[str], shared_context: Dict[str, Any],
+                      results: '_SequenceResults',
+                      positions: Optional[range] = None) -> int:
+        """Run independent codes concurrently, preserving input order"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run_one(i: int, code: str) -> SequenceResult:
+            # Each code gets its own context snapshot; concurrent handlers
+            # must not rely on each other's context updates
+            context = dict(shared_context, sequence_position=i)
+            try:
+                result = self.registry.execute(code, context)
+                return SequenceResult(code=code, position=i, success=True,
+                                      result=result,
+                                      timestamp_ns=time.monotonic_ns())
+            except Exception as e:
+                logger.error(f"Error executing code at position {i}: {e}")
+                return SequenceResult(code=code, position=i, success=False,
+                                      error=str(e),
+                                      timestamp_ns=time.monotonic_ns())
+
+        if positions is None:
+            positions = range(len(sequence))
+        with ThreadPoolExecutor(max_workers=min(len(sequence), 8)) as pool:
+            batch = list(pool.map(run_one, positions, sequence))
+        results.extend(batch)
+        return sum(1 for r in batch if r.success)
+
+    def execute_sequence_batched(self, sequence: List[str],
+                                 deps: Optional[Callable[[str, str], bool]] = None
+                                 ) -> List[SequenceResult]:
+        """Execute a sequence in stages, fanning out independent codes.
+
+        Consecutive codes of the same kind with no reference to earlier
+        outputs (named agents, checkpoints) run concurrently within a
+        stage; everything else executes serially with full context flow.
+        A custom `deps(prev_code, code)` predicate overrides the heuristic.
+        """
+        wall_start = datetime.now()
+        shared_context = {
+            'sequence_id': wall_start.strftime('%Y%m%d_%H%M%S_%f'),
+            'sequence_start': wall_start
         }
-        
+        results = _SequenceResults()
+        success_count = 0
+        t0_ns = time.monotonic_ns()
+        pos = 0
+
+        for stage in self._build_stages(sequence, deps):
+            if len(stage) > 1:
+                success_count += self._run_parallel(
+                    stage, shared_context, results,
+                    positions=range(pos, pos + len(stage))
+                )
+                pos += len(stage)
+                continue
+
+            # Serial stage: same semantics as execute_sequence, including
+            # context updates and abort-on-critical-error
+            code = stage[0]
+            shared_context['sequence_position'] = pos
+            r = SequenceResult(code=code, position=pos)
+            try:
+                result = self.registry.execute(code, shared_context)
+                r.success = True
+                r.result = result
+                r.timestamp_ns = time.monotonic_ns()
+                results.append(r)
+                success_count += 1
+                if isinstance(result, dict):
+                    shared_context.update(
+                        {k: v for k, v in result.items() if k not in _PROTECTED_KEYS}
+                    )
+            except Exception as e:
+                logger.error(f"Error executing code at position {pos}: {e}")
+                r.error = str(e)
+                r.timestamp_ns = time.monotonic_ns()
+                results.append(r)
+                if self._should_abort_sequence(e, pos, len(sequence)):
+                    logger.warning("Aborting sequence due to critical error")
+                    break
+            pos += 1
+
+        return self._finish_sequence(sequence, results, success_count,
+                                     wall_start, t0_ns)
+
+    @staticmethod
+    def _build_stages(sequence: List[str],
+                      deps: Optional[Callable[[str, str], bool]] = None
+                      ) -> List[List[str]]:
+        """Group consecutive independent codes of one kind into stages"""
+        stages: List[List[str]] = []
+        batch: List[str] = []
+        batch_name = None
+
+        for code in sequence:
+            name = code.partition(':')[0]
+            if deps is not None:
+                dependent = bool(batch) and deps(batch[-1], code)
+            else:
+                dependent = _STAGE_BREAK_RE.search(code) is not None
+
+            if dependent:
+                if batch:
+                    stages.append(batch)
+                    batch, batch_name = [], None
+                stages.append([code])
+                continue
+
+            if batch and name != batch_name:
+                stages.append(batch)
+                batch = []
+            batch.append(code)
+            batch_name = name
+
+        if batch:
+            stages.append(batch)
+        return stages
+
+    def _finish_sequence(self, sequence: List[str], results: '_SequenceResults',
+                         success_count: int, wall_start: datetime,
+                         t0_ns: int) -> '_SequenceResults':
+        """Finalize timestamps and record the sequence in memory"""
+        duration = (time.monotonic_ns() - t0_ns) / 1e9
+        self._finalize_timestamps(results, wall_start, t0_ns)
+        results.success_count = success_count
+
+        # Record sequence in memory
+        sequence_record = SequenceRecord(
+            sequence=sequence,
+            results=results,
+            timestamp=datetime.now(),
+            duration=duration,
+            completed=len(results) == len(sequence),
+            success_count=success_count,
+            success_rate=success_count / len(results) if results else 0
+        )
+
         self._add_to_memory(sequence_record)
-        logger.info(f"Sequence completed. Success rate: {sequence_record['success_rate']*100:.1f}%")
-        
+        logger.info(f"Sequence completed. Success rate: {sequence_record.success_rate*100:.1f}%")
+
         return results
-    
+
+    @staticmethod
+    def _finalize_timestamps(results: List[SequenceResult], wall_start: datetime,
+                             t0_ns: int):
+        """Convert monotonic offsets into ISO timestamps in one batch"""
+        for r in results:
+            offset_us = (r.timestamp_ns - t0_ns) // 1000
+            r.timestamp = (wall_start + timedelta(microseconds=offset_us)).isoformat()
+
     def _should_abort_sequence(self, error: Exception, position: int, total: int) -> bool:
         """Determine if sequence should be aborted based on error"""
-        # Critical errors that should stop execution
-        critical_errors = [
-            "Missing required context",
-            "Unknown jump code",
-            "Invalid jump code format"
-        ]
-        
-        error_msg = str(error)
-        for critical in critical_errors:
-            if critical in error_msg:
-                return True
-        
-        # Don't abort on last item
-        if position == total - 1:
-            return False
-        
-        # Continue by default
-        return False
+        # Abort only on critical errors; non-critical errors continue
+        return _CRITICAL_RE.search(str(error)) is not None
     
-    def _add_to_memory(self, record: Dict[str, Any]):
-        """Add sequence record to memory with size limit"""
+    def _add_to_memory(self, record: SequenceRecord):
+        """Add sequence record to memory; the deque enforces the size limit"""
         self.sequence_memory.append(record)
-        
-        # Maintain memory size limit
-        if len(self.sequence_memory) > self.max_memory_size:
-            self.sequence_memory = self.sequence_memory[-self.max_memory_size:]
-    
-    def get_history(self, limit: int = 10) -> List[Dict[str, Any]]:
+
+    def get_history(self, limit: int = 10) -> List[SequenceRecord]:
         """Get recent sequence execution history"""
-        return self.sequence_memory[-limit:]
+        n = len(self.sequence_memory)
+        return list(islice(self.sequence_memory, max(0, n - limit), n))
     
-    def find_successful_sequences(self) -> List[Dict[str, Any]]:
+    def find_successful_sequences(self) -> List[SequenceRecord]:
         """Find all completely successful sequences"""
-        return [seq for seq in self.sequence_memory 
-                if seq['completed'] and seq['success_rate'] == 1.0]
-    
-    def replay_sequence(self, sequence_index: int) -> List[Dict[str, Any]]:
+        return [seq for seq in self.sequence_memory
+                if seq.completed and seq.success_rate == 1.0]
+
+    def replay_sequence(self, sequence_index: int) -> List[SequenceResult]:
         """Replay a sequence from history"""
         if 0 <= sequence_index < len(self.sequence_memory):
-            sequence = self.sequence_memory[sequence_index]['sequence']
+            sequence = self.sequence_memory[sequence_index].sequence
             logger.info(f"Replaying sequence from history: {sequence_index}")
             return self.execute_sequence(sequence)
         else:
             raise ValueError(f"Invalid sequence index: {sequence_index}")
 
 
+# Expansions before a macro gets compiled to a specialized closure
+_MACRO_JIT_THRESHOLD = 8
+
+# Bound on cached (macro, params) expansions
+_EXPAND_CACHE_MAX = 256
+
+
+def _compile_macro_expander(compiled) -> 'Callable':
+    """Generate a specialized expansion function for a hot macro.
+
+    Emits source that concatenates the macro's literal segments with direct
+    params[...] lookups, so expansion runs a handful of opcodes instead of
+    a generator-driven join per code.
+    """
+    lines = []
+    for parts in compiled:
+        pieces = []
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                if part:
+                    pieces.append(repr(part))
+            else:
+                pieces.append(f"params[{part!r}]")
+        lines.append(' + '.join(pieces) if pieces else "''")
+
+    src = "def _expand(params):\n    return [\n"
+    src += ",\n".join(f"        {line}" for line in lines)
+    src += "\n    ]\n"
+
+    namespace: Dict[str, Any] = {}
+    exec(src, {}, namespace)
+    return namespace['_expand']
+
+
 class JumpCodeMacros:
     """Define and manage reusable jump code sequences"""
     
     def __init__(self):
         self.macros: Dict[str, Dict[str, Any]] = {}
+        # LRU of fully expanded sequences keyed by (name, sorted params)
+        self._expand_cache: OrderedDict = OrderedDict()
         self._load_default_macros()
     
     def _load_default_macros(self):
@@ -183,38 +480,67 @@ class JumpCodeMacros:
                     '@parallel:tasks=analyze_structure;scan_security;profile_performance'
                 ],
                 'description': 'Parallel code analysis workflow',
-                'parameters': []
+                'parameters': [],
+                'parallel': True
             }
         }
-        
+
         for name, config in defaults.items():
             self.define_macro(
                 name=name,
                 sequence=config['sequence'],
                 description=config['description'],
-                parameters=config.get('parameters', [])
+                parameters=config.get('parameters', []),
+                parallel=config.get('parallel', False)
             )
     
-    def define_macro(self, name: str, sequence: List[str], 
-                    description: str = "", parameters: List[str] = None):
+    def define_macro(self, name: str, sequence: List[str],
+                    description: str = "", parameters: List[str] = None,
+                    parallel: bool = False):
         """Define a new macro"""
-        if not re.match(r'^[a-zA-Z_]\w*$', name):
+        # isidentifier is a C-level check equivalent to the old
+        # ^[a-zA-Z_]\w*$ regex for macro names
+        if not (name and name.isidentifier()):
             raise ValueError(f"Invalid macro name format: {name}")
-        
+
+        self._define_macro_fast(name, sequence, description, parameters,
+                                time.time(), parallel)
+
+    def _define_macro_fast(self, name: str, sequence: List[str],
+                           description: str, parameters: Optional[List[str]],
+                           created: float, parallel: bool = False):
+        """Store a macro without validation; bulk loads share one timestamp"""
+        # Parse each code once at definition time: _PARAM_RE.split yields
+        # [literal, param, literal, param, ..., literal], so expansion is a
+        # plain join instead of a regex substitution per code per call
+        compiled = [tuple(_PARAM_RE.split(code)) for code in sequence]
+        if parameters is None:
+            # Odd indices of each split are the placeholder names
+            parameters = sorted({p for parts in compiled for p in parts[1::2]})
+
         self.macros[name] = {
             'sequence': sequence,
             'description': description,
-            'parameters': parameters or [],
-            'created': datetime.now(),
-            'usage_count': 0
+            'parameters': parameters,
+            'created': created,
+            'usage_count': 0,
+            'parallel': parallel,
+            '_compiled': compiled
         }
-        
+        self._invalidate_expansions(name)
+
         logger.info(f"Macro '{name}' defined with {len(sequence)} steps")
+
+    def _invalidate_expansions(self, name: str):
+        """Drop cached expansions for a redefined or removed macro"""
+        for key in [k for k in self._expand_cache if k[0] == name]:
+            del self._expand_cache[key]
     
     def undefine_macro(self, name: str) -> bool:
         """Remove a macro definition"""
         if name in self.macros:
             del self.macros[name]
+            self._invalidate_expansions(name)
             logger.info(f"Macro '{name}' removed")
             return True
         return False
@@ -232,33 +558,47 @@ class JumpCodeMacros:
         if missing_params:
             raise ValueError(f"Missing required parameters for macro '{name}': {missing_params}")
         
-        # Expand sequence with parameter substitution
-        expanded_sequence = []
-        for code in macro['sequence']:
-            expanded_code = self._substitute_params(code, params)
-            expanded_sequence.append(expanded_code)
-        
-        # Update usage count
+        # Repeat expansions with identical params come straight from the LRU
+        cache_key = (name, tuple(sorted(params.items())))
+        cached = self._expand_cache.get(cache_key)
+        if cached is not None:
+            self._expand_cache.move_to_end(cache_key)
+            macro['usage_count'] += 1
+            return list(cached)
+
+        # Hot macros run their compiled expander; fall back to the generic
+        # join if a referenced parameter wasn't supplied
+        expanded_sequence = None
+        jit = macro.get('_jit')
+        if jit is not None:
+            try:
+                expanded_sequence = jit(params)
+            except KeyError:
+                expanded_sequence = None
+
+        if expanded_sequence is None:
+            # Join the precomputed literal/param segments; unknown parameters
+            # keep their original ${name} form
+            expanded_sequence = [
+                ''.join(
+                    part if i % 2 == 0 else params.get(part, '${' + part + '}')
+                    for i, part in enumerate(parts)
+                )
+                for parts in macro['_compiled']
+            ]
+
+        # Update usage count, compiling the macro once it proves hot
         macro['usage_count'] += 1
-        
+        if jit is None and macro['usage_count'] >= _MACRO_JIT_THRESHOLD:
+            macro['_jit'] = _compile_macro_expander(macro['_compiled'])
+
+        self._expand_cache[cache_key] = tuple(expanded_sequence)
+        if len(self._expand_cache) > _EXPAND_CACHE_MAX:
+            self._expand_cache.popitem(last=False)
+
         logger.info(f"Macro '{name}' expanded with {len(params)} parameters")
         return expanded_sequence
     
-    def _substitute_params(self, code: str, params: Dict[str, str]) -> str:
-        """Substitute parameters in a jump code string"""
-        # Pattern to match ${param_name}
-        pattern = r'\$\{(\w+)\}'
-        
-        def replacer(match):
-            param_name = match.group(1)
-            if param_name in params:
-                return params[param_name]
-            else:
-                # Keep original if parameter not provided
-                return match.group(0)
-        
-        return re.sub(pattern, replacer, code)
-    
     def list_macros(self) -> Dict[str, Dict[str, Any]]:
         """List all available macros"""
         return {
@@ -273,43 +613,58 @@ class JumpCodeMacros:
     
     def get_macro_details(self, name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a macro"""
-        if name in self.macros:
-            macro = self.macros[name].copy()
-            # Don't expose internal fields
-            macro.pop('created', None)
-            return macro
-        return None
+        macro = self.macros.get(name)
+        if macro is None:
+            return None
+        # Build from the exposed keys only instead of copying the full
+        # record and popping internal fields back out
+        return {
+            'sequence': macro['sequence'],
+            'description': macro['description'],
+            'parameters': macro['parameters'],
+            'usage_count': macro['usage_count']
+        }
     
     def save_macros(self, filename: str):
         """Save macros to file"""
-        data = {
-            name: {
-                'sequence': macro['sequence'],
-                'description': macro['description'],
-                'parameters': macro['parameters']
-            }
-            for name, macro in self.macros.items()
-        }
-        
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        logger.info(f"Saved {len(data)} macros to {filename}")
+        # Stream one encoded entry per macro instead of materializing the
+        # whole export dict and handing it to json.dump
+        with open(filename, 'wb') as f:
+            f.write(b'{')
+            first = True
+            for name, macro in self.macros.items():
+                if not first:
+                    f.write(b',')
+                first = False
+                f.write(orjson.dumps(name))
+                f.write(b': ')
+                f.write(orjson.dumps({
+                    'sequence': macro['sequence'],
+                    'description': macro['description'],
+                    'parameters': macro['parameters']
+                }))
+            f.write(b'}')
+
+        logger.info(f"Saved {len(self.macros)} macros to {filename}")
     
     def load_macros(self, filename: str):
         """Load macros from file"""
         try:
             with open(filename, 'r') as f:
                 data = json.load(f)
-            
+
+            # One clock read for the whole batch; skip per-macro validation
+            # for names we serialized ourselves
+            now = time.time()
             for name, config in data.items():
-                self.define_macro(
-                    name=name,
-                    sequence=config['sequence'],
-                    description=config.get('description', ''),
-                    parameters=config.get('parameters', [])
+                self._define_macro_fast(
+                    name,
+                    config['sequence'],
+                    config.get('description', ''),
+                    config.get('parameters', []),
+                    now
                 )
-            
+
             logger.info(f"Loaded {len(data)} macros from {filename}")
         except Exception as e:
             logger.error(f"Failed to load macros from {filename}: {e}")
@@ -329,60 +684,68 @@ class JumpCodeMiddleware:
     def _register_macro_codes(self):
         """Register jump codes for macro operations"""
         from jump_codes import JumpCode
-        
-        # Define macro jump code
-        self.jump_registry.register(JumpCode(
-            code="define_macro",
-            description="Define a new macro",
-            handler=self._define_macro_handler,
-            parameters={"name": "", "sequence": [], "description": ""},
-            aliases=["macro", "m"]
-        ))
-        
-        # Execute macro jump code
-        self.jump_registry.register(JumpCode(
-            code="exec_macro",
-            description="Execute a macro",
-            handler=self._exec_macro_handler,
-            parameters={"name": "", "params": {}},
-            aliases=["em", "run_macro"]
-        ))
-        
-        # List macros jump code
-        self.jump_registry.register(JumpCode(
-            code="list_macros",
-            description="List all available macros",
-            handler=self._list_macros_handler,
-            parameters={},
-            aliases=["lm", "macros"]
-        ))
+
+        # One bulk registration instead of three register round trips
+        self.jump_registry.register_many([
+            JumpCode(
+                code="define_macro",
+                description="Define a new macro",
+                handler=self._define_macro_handler,
+                parameters={"name": "", "sequence": [], "description": ""},
+                aliases=["macro", "m"]
+            ),
+            JumpCode(
+                code="exec_macro",
+                description="Execute a macro",
+                handler=self._exec_macro_handler,
+                parameters={"name": "", "params": {}},
+                aliases=["em", "run_macro"]
+            ),
+            JumpCode(
+                code="list_macros",
+                description="List all available macros",
+                handler=self._list_macros_handler,
+                parameters={},
+                aliases=["lm", "macros"]
+            ),
+        ])
     
     def process_input(self, user_input: str) -> Optional[Dict[str, Any]]:
         """Process user input for jump codes and macros"""
-        # Direct jump code
-        if user_input.startswith('@'):
+        # Dispatch on the first character so plain text never touches the
+        # macro regex and direct codes never scan for sequences or inlines
+        c = user_input[:1]
+
+        if c == '@':
+            # '@@'-prefixed input is a sequence, not a single code
+            if user_input.startswith('@@'):
+                codes = _SEQ_RE.findall(user_input)
+                if codes:
+                    return self._process_sequence(codes)
             return self._process_single_code(user_input)
-        
+
         # Macro execution shorthand: !macro_name(param1=value1, param2=value2)
-        macro_pattern = r'^!(\w+)\(([^)]*)\)$'
-        macro_match = re.match(macro_pattern, user_input)
-        if macro_match:
-            macro_name = macro_match.group(1)
-            params_str = macro_match.group(2)
-            params = self._parse_macro_params(params_str)
-            return self._exec_macro_handler({}, name=macro_name, params=params)
-        
-        # Sequence execution: @@code1 @@code2 @@code3
+        if c == '!':
+            # fullmatch instead of ^...$ anchors: a failed match bails at
+            # the length check rather than backtracking to satisfy '$'
+            macro_match = _MACRO_CALL_RE.fullmatch(user_input)
+            if macro_match:
+                macro_name = macro_match.group(1)
+                params_str = macro_match.group(2)
+                params = self._parse_macro_params(params_str)
+                return self._exec_macro_handler({}, name=macro_name, params=params)
+
+        # Sequence codes embedded in text: run @@code1 @@code2
         if '@@' in user_input:
-            codes = re.findall(r'@@(\S+)', user_input)
+            codes = _SEQ_RE.findall(user_input)
             if codes:
                 return self._process_sequence(codes)
-        
-        # Inline jump codes: {some text {@code} more text}
-        inline_pattern = r'\{@([^}]+)\}'
-        if re.search(inline_pattern, user_input):
+
+        # Inline jump codes: {some text {@code} more text}; cheap substring
+        # gate before the regex scan
+        if '{@' in user_input and _INLINE_RE.search(user_input):
             return self._process_inline_codes(user_input)
-        
+
         return None
     
     def _process_single_code(self, code: str) -> Dict[str, Any]:
@@ -402,31 +765,34 @@ class JumpCodeMiddleware:
         codes = [f"@{code}" if not code.startswith('@') else code for code in codes]
         
         results = self.sequential.execute_sequence(codes)
-        
+
         return {
             'type': 'sequence_execution',
             'codes': codes,
             'results': results,
-            'success_count': sum(1 for r in results if r['success']),
+            # Per-code status lines built in the same pass that display
+            # consumers used to re-walk the results for
+            'lines': [("✓ " if r.success else "✗ ") + r.code for r in results],
+            'success_count': results.success_count,
             'total_count': len(results)
         }
     
     def _process_inline_codes(self, text: str) -> Dict[str, Any]:
         """Process inline jump codes within text"""
-        inline_pattern = r'\{@([^}]+)\}'
         results = []
-        processed_text = text
-        
-        for match in re.finditer(inline_pattern, text):
-            code = f"@{match.group(1)}"
-            result = self._process_single_code(code)
+
+        def replacer(match):
+            result = self._process_single_code(f"@{match.group(1)}")
             results.append(result)
-            
-            # Replace inline code with result summary if successful
-            if not result.get('error'):
-                summary = result.get('message', 'Executed')
-                processed_text = processed_text.replace(match.group(0), f"[{summary}]")
-        
+            # Substitute the result summary if successful, else keep the code
+            if result.get('error'):
+                return match.group(0)
+            return f"[{result.get('message', 'Executed')}]"
+
+        # Single left-to-right pass; each occurrence is executed and replaced
+        # exactly once, unlike str.replace which rewrote every duplicate
+        processed_text = _INLINE_RE.sub(replacer, text)
+
         return {
             'type': 'inline_execution',
             'original_text': text,
@@ -436,14 +802,10 @@ class JumpCodeMiddleware:
     
     def _parse_macro_params(self, params_str: str) -> Dict[str, str]:
         """Parse macro parameters from string"""
-        params = {}
-        if params_str:
-            for param in params_str.split(','):
-                param = param.strip()
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    params[key.strip()] = value.strip()
-        return params
+        # One tokenizing scan instead of split/strip per parameter
+        if not params_str:
+            return {}
+        return {k: v.strip() for k, v in _PARAM_KV_RE.findall(params_str)}
     
     # Macro handlers
     def _define_macro_handler(self, context: Dict[str, Any], 
@@ -451,24 +813,19 @@ class JumpCodeMiddleware:
                             description: str = "", **kwargs) -> Dict[str, Any]:
         """Handler for defining macros"""
         try:
-            # Extract parameters from sequence
-            params = set()
-            pattern = r'\$\{(\w+)\}'
-            for code in sequence:
-                params.update(re.findall(pattern, code))
-            
+            # define_macro derives the parameter list from its single parse
+            # pass over the sequence, so don't re-scan here
             self.macros.define_macro(
                 name=name,
                 sequence=sequence,
-                description=description,
-                parameters=list(params)
+                description=description
             )
-            
+
             return {
                 'type': 'macro_defined',
                 'name': name,
                 'steps': len(sequence),
-                'parameters': list(params),
+                'parameters': self.macros.macros[name]['parameters'],
                 'message': f"Macro '{name}' defined successfully"
             }
         except Exception as e:
@@ -484,9 +841,13 @@ class JumpCodeMiddleware:
         try:
             # Expand macro
             sequence = self.macros.expand_macro(name, params or {})
-            
-            # Execute sequence
-            results = self.sequential.execute_sequence(sequence)
+
+            # Execute sequence; macros flagged parallel fan out their
+            # independent codes across the thread pool
+            results = self.sequential.execute_sequence(
+                sequence,
+                parallel=self.macros.macros[name].get('parallel', False)
+            )
             
             return {
                 'type': 'macro_executed',
@@ -494,7 +855,7 @@ class JumpCodeMiddleware:
                 'parameters': params or {},
                 'sequence_length': len(sequence),
                 'results': results,
-                'success_rate': sum(1 for r in results if r['success']) / len(results) if results else 0,
+                'success_rate': results.success_count / len(results) if results else 0,
                 'message': f"Macro '{name}' executed with {len(sequence)} steps"
             }
         except Exception as e:
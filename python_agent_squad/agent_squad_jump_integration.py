@@ -29,141 +29,197 @@ except ImportError:
 
 from jump_codes import JumpCodeRegistry, JumpCode
 from typing import Dict, Any, List, Optional
+import asyncio
 import json
 import logging
+import os
+import re
+import sys
+import tempfile
+import time
+
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from itertools import count
 
 logger = logging.getLogger(__name__)
 
+# Inline jump codes like {@status}; compiled once rather than per input
+_INLINE_JUMP_RE = re.compile(r'\{@([^}]+)\}')
+
+# Splits "task1; task2 ;task3" trimming surrounding whitespace in one pass
+_PARALLEL_SEP_RE = re.compile(r'\s*;\s*')
+
+
+# Interned ids for the first 256 agents; the common case reuses one
+# string object instead of formatting a new one per create
+_AGENT_IDS = tuple(sys.intern(f"agent_{i}") for i in range(256))
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode a state payload to indented JSON bytes.
+
+    orjson traverses nested dicts/lists in native code; anything it can't
+    encode (stray datetimes and the like) falls back to str().
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+
+
+def _atomic_write(filename: str, payload: bytes):
+    """Write a checkpoint atomically: temp file in place, then rename.
+
+    A crash mid-write leaves the previous checkpoint intact instead of a
+    truncated JSON file.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(filename) or '.',
+        prefix=f'.{os.path.basename(filename)}.',
+        suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 class EnhancedAgentSquad:
     """Enhanced Agent Squad with Jump Code support"""
-    
+
+    # Fixed attribute layout: no per-instance __dict__, faster lookups
+    __slots__ = ('jump_registry', 'agents', 'tasks', 'crews',
+                 'current_context', '_executor', '_agent_seq', '_crew_seq',
+                 '_crew_cache')
+
+    # (code, description, handler name, default parameters, aliases)
+    # Shared across instances and bulk-registered in __init__; execute()
+    # merges defaults by spread, so the dicts are never mutated.
+    _SQUAD_JUMP_SPECS = (
+        ("create_agent", "Quickly create a new agent with predefined template",
+         "_create_agent_handler",
+         {"role": "", "goal": "", "backstory": "", "tools": []},
+         ("ca", "new_agent")),
+        ("assign_task", "Assign task to specific agent",
+         "_assign_task_handler",
+         {"agent": "", "task": "", "priority": "normal"},
+         ("at", "task")),
+        ("run_workflow", "Execute predefined workflow",
+         "_run_workflow_handler",
+         {"workflow": "", "async": False},
+         ("rw", "exec")),
+        ("switch_context", "Switch to different project context",
+         "_switch_context_handler",
+         {"context": "", "preserve_state": True},
+         ("sc", "ctx")),
+        ("list_agents", "List all available agents",
+         "_list_agents_handler",
+         {},
+         ("la", "agents")),
+        ("save_state", "Save current state to checkpoint",
+         "_save_state_handler",
+         {"name": "", "include": ["agents", "tasks", "results"]},
+         ("save", "checkpoint")),
+        ("restore_state", "Restore from saved checkpoint",
+         "_restore_state_handler",
+         {"name": "", "partial": False},
+         ("restore", "load")),
+        ("chain", "Chain multiple tasks together",
+         "_chain_tasks_handler",
+         {"tasks": []},
+         ("ch", "sequence")),
+        ("debug", "Enable debug mode for agents",
+         "_debug_handler",
+         {"agent": "all", "verbose": True, "save_logs": False},
+         ("dbg", "d")),
+        ("template", "Apply workflow template",
+         "_template_handler",
+         {"name": "", "agents": []},
+         ("tpl", "t")),
+        ("parallel", "Execute tasks in parallel",
+         "_parallel_handler",
+         {"tasks": "", "timeout": 300, "fail_fast": False},
+         ("par", "concurrent")),
+    )
+
     def __init__(self):
         self.jump_registry = JumpCodeRegistry()
         self.agents: Dict[str, Agent] = {}
         self.tasks: List[Task] = []
         self.crews: Dict[str, Crew] = {}
         self.current_context = {
-            'session_id': datetime.now().strftime('%Y%m%d_%H%M%S'),
+            # time.strftime skips the datetime object construction these
+            # second-resolution ids never needed
+            'session_id': time.strftime('%Y%m%d_%H%M%S'),
             'agents': {},
             'tasks': [],
             'results': []
         }
+        # Shared pool for @parallel, created on first use
+        self._executor = None
+        # Monotonic id sources; unlike len()-based ids these never collide
+        # after deletes and cost a single C-level increment
+        self._agent_seq = count(1)
+        self._crew_seq = count(1)
+        # Crews keyed by roster signature; cleared whenever the roster
+        # or task list changes
+        self._crew_cache = {}
         self._register_squad_jump_codes()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared parallel-dispatch pool, creating it lazily.
+
+        Reusing one pool amortizes thread startup across @parallel calls
+        instead of spawning and tearing down workers per dispatch.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4),
+                thread_name_prefix='squad-par'
+            )
+        return self._executor
+
+    def close(self):
+        """Shut down the shared executor, if one was created"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     def _register_squad_jump_codes(self):
-        """Register agent-squad specific jump codes"""
-        
-        # Agent creation jump code
-        self.jump_registry.register(JumpCode(
-            code="create_agent",
-            description="Quickly create a new agent with predefined template",
-            handler=self._create_agent_handler,
-            parameters={"role": "", "goal": "", "backstory": "", "tools": []},
-            aliases=["ca", "new_agent"]
-        ))
-        
-        # Task assignment jump code
-        self.jump_registry.register(JumpCode(
-            code="assign_task",
-            description="Assign task to specific agent",
-            handler=self._assign_task_handler,
-            parameters={"agent": "", "task": "", "priority": "normal"},
-            aliases=["at", "task"]
-        ))
-        
-        # Workflow execution jump code
-        self.jump_registry.register(JumpCode(
-            code="run_workflow",
-            description="Execute predefined workflow",
-            handler=self._run_workflow_handler,
-            parameters={"workflow": "", "async": False},
-            aliases=["rw", "exec"]
-        ))
-        
-        # Context switching jump code
-        self.jump_registry.register(JumpCode(
-            code="switch_context",
-            description="Switch to different project context",
-            handler=self._switch_context_handler,
-            parameters={"context": "", "preserve_state": True},
-            aliases=["sc", "ctx"]
-        ))
-        
-        # List agents jump code
-        self.jump_registry.register(JumpCode(
-            code="list_agents",
-            description="List all available agents",
-            handler=self._list_agents_handler,
-            parameters={},
-            aliases=["la", "agents"]
-        ))
-        
-        # Save state jump code
-        self.jump_registry.register(JumpCode(
-            code="save_state",
-            description="Save current state to checkpoint",
-            handler=self._save_state_handler,
-            parameters={"name": "", "include": ["agents", "tasks", "results"]},
-            aliases=["save", "checkpoint"]
-        ))
-        
-        # Restore state jump code
-        self.jump_registry.register(JumpCode(
-            code="restore_state",
-            description="Restore from saved checkpoint",
-            handler=self._restore_state_handler,
-            parameters={"name": "", "partial": False},
-            aliases=["restore", "load"]
-        ))
-        
-        # Chain tasks jump code
-        self.jump_registry.register(JumpCode(
-            code="chain",
-            description="Chain multiple tasks together",
-            handler=self._chain_tasks_handler,
-            parameters={"tasks": []},
-            aliases=["ch", "sequence"]
-        ))
-        
-        # Debug jump code
-        self.jump_registry.register(JumpCode(
-            code="debug",
-            description="Enable debug mode for agents",
-            handler=self._debug_handler,
-            parameters={"agent": "all", "verbose": True, "save_logs": False},
-            aliases=["dbg", "d"]
-        ))
-        
-        # Template jump code
-        self.jump_registry.register(JumpCode(
-            code="template",
-            description="Apply workflow template",
-            handler=self._template_handler,
-            parameters={"name": "", "agents": []},
-            aliases=["tpl", "t"]
-        ))
-        
-        # Parallel execution jump code
-        self.jump_registry.register(JumpCode(
-            code="parallel",
-            description="Execute tasks in parallel",
-            handler=self._parallel_handler,
-            parameters={"tasks": "", "timeout": 300, "fail_fast": False},
-            aliases=["par", "concurrent"]
-        ))
+        """Register agent-squad specific jump codes from the shared spec table"""
+        # Interned names make every registry dict lookup a pointer compare
+        # when the incoming token is interned too
+        self.jump_registry.register_many([
+            JumpCode(
+                code=sys.intern(code),
+                description=description,
+                handler=getattr(self, handler_name),
+                parameters=parameters,
+                aliases=[sys.intern(a) for a in aliases]
+            )
+            for code, description, handler_name, parameters, aliases
+            in self._SQUAD_JUMP_SPECS
+        ])
     
     def process_jump_code(self, code_string: str) -> Dict[str, Any]:
         """Process jump code from user input"""
+        # Bare short codes ("@status", "@la") recur constantly; interning
+        # them lets the registry resolve names by identity
+        if len(code_string) < 32 and ':' not in code_string:
+            code_string = sys.intern(code_string)
         try:
             result = self.jump_registry.execute(
-                code_string, 
+                code_string,
                 context=self.current_context
             )
-            logger.info(f"Jump code executed successfully: {code_string}")
+            # Skip formatting entirely when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Jump code executed successfully: %s", code_string)
             return result
         except Exception as e:
-            logger.error(f"Jump code error: {str(e)}")
+            logger.error("Jump code error: %s", e)
             return {
                 'error': True,
                 'message': f"Jump code error: {str(e)}",
@@ -172,15 +228,21 @@ class EnhancedAgentSquad:
     
     def process_input_with_jump_codes(self, user_input: str) -> Optional[Dict[str, Any]]:
         """Process user input and extract/execute jump codes"""
+        # Plain text without any '@' can never contain a jump code;
+        # one substring scan rejects the common case immediately
+        if '@' not in user_input:
+            return None
+
         # Check for direct jump code
         if user_input.startswith('@'):
             return self.process_jump_code(user_input)
         
-        # Check for inline jump codes
-        import re
-        inline_pattern = r'\{@([^}]+)\}'
-        matches = re.findall(inline_pattern, user_input)
-        
+        # Check for inline jump codes; cheap substring gate keeps plain text
+        # off the regex engine entirely
+        if '{@' not in user_input:
+            return None
+        matches = _INLINE_JUMP_RE.findall(user_input)
+
         if matches:
             results = []
             for match in matches:
@@ -195,9 +257,10 @@ class EnhancedAgentSquad:
         return None
     
     # Jump code handlers
-    def _create_agent_handler(self, context: Dict[str, Any], 
-                            role: str, goal: str, backstory: str, 
-                            tools: List[str] = None, **kwargs) -> Dict[str, Any]:
+    def _create_agent_handler(self, context: Dict[str, Any],
+                            role: str, goal: str, backstory: str,
+                            tools: List[str] = None, created_at: str = None,
+                            **kwargs) -> Dict[str, Any]:
         """Create a new agent"""
         try:
             # Validate inputs
@@ -217,14 +280,18 @@ class EnhancedAgentSquad:
             )
             
             # Store agent
-            agent_id = f"agent_{len(self.agents) + 1}"
+            n = next(self._agent_seq)
+            agent_id = _AGENT_IDS[n] if n < len(_AGENT_IDS) else f"agent_{n}"
             self.agents[agent_id] = agent
+            self._crew_cache.clear()
             
-            # Update context
-            context['agents'][agent_id] = {
+            # Update context; one lookup for the container, not per write
+            agents_ctx = context.setdefault('agents', {})
+            agents_ctx[agent_id] = {
                 'role': role,
                 'goal': goal,
-                'created_at': datetime.now().isoformat()
+                # Batch callers pass one timestamp for the whole batch
+                'created_at': created_at or datetime.now().isoformat()
             }
             
             return {
@@ -241,9 +308,9 @@ class EnhancedAgentSquad:
                 'message': f"Failed to create agent: {str(e)}"
             }
     
-    def _assign_task_handler(self, context: Dict[str, Any], 
-                           agent: str, task: str, priority: str = "normal", 
-                           **kwargs) -> Dict[str, Any]:
+    def _assign_task_handler(self, context: Dict[str, Any],
+                           agent: str, task: str, priority: str = "normal",
+                           assigned_at: str = None, **kwargs) -> Dict[str, Any]:
         """Assign a task to an agent"""
         try:
             # Find agent
@@ -263,13 +330,16 @@ class EnhancedAgentSquad:
             
             # Store task
             self.tasks.append(task_obj)
+            self._crew_cache.clear()
             
             # Update context
-            context['tasks'].append({
+            tasks_ctx = context.setdefault('tasks', [])
+            tasks_ctx.append({
                 'agent': agent,
                 'description': task,
                 'priority': priority,
-                'assigned_at': datetime.now().isoformat()
+                # Batch callers pass one timestamp for the whole batch
+                'assigned_at': assigned_at or datetime.now().isoformat()
             })
             
             return {
@@ -303,16 +373,21 @@ class EnhancedAgentSquad:
                     'message': "No tasks available to run"
                 }
             
-            # Create crew
-            crew = Crew(
-                agents=list(self.agents.values()),
-                tasks=self.tasks,
-                verbose=True,
-                process="sequential"  # or "hierarchical"
-            )
+            # Reuse a crew built for the same roster and task count;
+            # repeated runs of an unchanged squad skip Crew construction
+            sig = (frozenset(self.agents), len(self.tasks))
+            crew = self._crew_cache.get(sig)
+            if crew is None:
+                crew = Crew(
+                    agents=list(self.agents.values()),
+                    tasks=self.tasks,
+                    verbose=True,
+                    process="sequential"  # or "hierarchical"
+                )
+                self._crew_cache[sig] = crew
             
             # Store crew
-            crew_id = f"crew_{workflow}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            crew_id = f"crew_{workflow}_{next(self._crew_seq)}"
             self.crews[crew_id] = crew
             
             # Execute
@@ -329,7 +404,8 @@ class EnhancedAgentSquad:
                 result = crew.kickoff()
                 
                 # Update context with results
-                context['results'].append({
+                results_ctx = context.setdefault('results', [])
+                results_ctx.append({
                     'workflow': workflow,
                     'crew_id': crew_id,
                     'result': str(result),
@@ -360,8 +436,9 @@ class EnhancedAgentSquad:
                 self._save_context_state(context['session_id'])
             
             # Create new context
+            self._crew_cache.clear()
             self.current_context = {
-                'session_id': f"{context_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                'session_id': f"{context_name}_{time.strftime('%Y%m%d_%H%M%S')}",
                 'agents': {},
                 'tasks': [],
                 'results': [],
@@ -384,17 +461,18 @@ class EnhancedAgentSquad:
     
     def _list_agents_handler(self, context: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """List all available agents"""
-        agents_info = []
-        
-        for agent_id, agent in self.agents.items():
-            agents_info.append({
+        # type() covers every object (hasattr check was dead weight) and a
+        # comprehension builds the list without per-iteration append lookups
+        agents_info = [
+            {
                 'id': agent_id,
                 'role': agent.role,
                 'goal': agent.goal,
-                'tools': [tool.__class__.__name__ if hasattr(tool, '__class__') else str(tool) 
-                         for tool in agent.tools] if agent.tools else []
-            })
-        
+                'tools': [type(tool).__name__ for tool in agent.tools or ()]
+            }
+            for agent_id, agent in self.agents.items()
+        ]
+
         return {
             'type': 'agents_list',
             'agents': agents_info,
@@ -407,7 +485,7 @@ class EnhancedAgentSquad:
         """Save current state"""
         try:
             if not name:
-                name = f"checkpoint_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                name = f"checkpoint_{time.strftime('%Y%m%d_%H%M%S')}"
             
             include = include or ["agents", "tasks", "results"]
             
@@ -424,10 +502,9 @@ class EnhancedAgentSquad:
             if "results" in include:
                 state['results'] = context.get('results', [])
             
-            # Save to file
+            # Save to file: encode once, write once, rename into place
             filename = f"state_{name}.json"
-            with open(filename, 'w') as f:
-                json.dump(state, f, indent=2)
+            _atomic_write(filename, _json_dumps(state))
             
             return {
                 'type': 'state_saved',
@@ -483,15 +560,19 @@ class EnhancedAgentSquad:
         """Chain multiple tasks together"""
         try:
             chained_results = []
-            
+            # One clock read and one format for the whole chain
+            assigned_at = datetime.now().isoformat()
+
             for task_desc in tasks:
-                # Parse task format: "agent:task_description"
-                if ':' in task_desc:
-                    agent_id, task_content = task_desc.split(':', 1)
+                # Parse task format: "agent:task_description"; partition
+                # scans the string once instead of an 'in' check plus split
+                agent_id, sep, task_content = task_desc.partition(':')
+                if sep:
                     result = self._assign_task_handler(
-                        context, 
-                        agent=agent_id.strip(), 
-                        task=task_content.strip()
+                        context,
+                        agent=agent_id.strip(),
+                        task=task_content.strip(),
+                        assigned_at=assigned_at
                     )
                     chained_results.append(result)
                 else:
@@ -534,7 +615,7 @@ class EnhancedAgentSquad:
             
             if save_logs:
                 # Configure logging to file
-                log_filename = f"debug_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+                log_filename = f"debug_logs_{time.strftime('%Y%m%d_%H%M%S')}.log"
                 file_handler = logging.FileHandler(log_filename)
                 file_handler.setLevel(logging.DEBUG)
                 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -598,7 +679,9 @@ class EnhancedAgentSquad:
             
             template = templates[name]
             results = []
-            
+            # Single timestamp shared by every agent the template creates
+            created_at = datetime.now().isoformat()
+
             # Create agents from template
             for agent_spec in template['agents']:
                 if not agents or agent_spec['role'] in agents:
@@ -606,14 +689,16 @@ class EnhancedAgentSquad:
                         context,
                         role=agent_spec['role'],
                         goal=agent_spec['goal'],
-                        backstory=agent_spec.get('backstory', '')
+                        backstory=agent_spec.get('backstory', ''),
+                        created_at=created_at
                     )
                     results.append(result)
             
-            # Create tasks from template
-            for task in template['tasks']:
-                result = self.process_jump_code(f"@chain:tasks={task}")
-                results.append(result)
+            # Create tasks from template in one direct chain call; the
+            # round trip through format-then-reparse added nothing but cost
+            results.append(
+                self._chain_tasks_handler(context, tasks=list(template['tasks']))
+            )
             
             return {
                 'type': 'template_applied',
@@ -633,8 +718,9 @@ class EnhancedAgentSquad:
                          fail_fast: bool = False, **kwargs) -> Dict[str, Any]:
         """Execute tasks in parallel"""
         try:
-            # Parse tasks string (format: "task1;task2;task3")
-            task_list = [t.strip() for t in tasks.split(';') if t.strip()]
+            # Parse tasks string (format: "task1;task2;task3"); the
+            # separator regex trims whitespace in the same pass
+            task_list = [t for t in _PARALLEL_SEP_RE.split(tasks.strip()) if t]
             
             if not task_list:
                 return {
@@ -642,59 +728,49 @@ class EnhancedAgentSquad:
                     'message': "No tasks provided for parallel execution"
                 }
             
-            # Import threading for parallel execution
-            import concurrent.futures
-            import time
-            
-            results = {}
-            failed = False
-            
+            # Timestamp captured once on the submitting thread; workers
+            # reuse it instead of hitting the clock per task
+            assigned_at = datetime.now().isoformat()
+            # Resolve the fallback agent once rather than rebuilding the
+            # agent-id list inside every worker
+            default_agent_id = next(iter(self.agents), None)
+
             def execute_task(task_str):
                 """Execute a single task"""
                 # Parse task format: "agent:task_description" or just "task_description"
-                if ':' in task_str:
-                    agent_id, task_desc = task_str.split(':', 1)
-                else:
+                agent_id, sep, task_desc = task_str.partition(':')
+                if not sep:
                     # Use first available agent
-                    if self.agents:
-                        agent_id = list(self.agents.keys())[0]
-                        task_desc = task_str
-                    else:
+                    if default_agent_id is None:
                         return {'error': 'No agents available'}
+                    agent_id = default_agent_id
+                    task_desc = task_str
                 
                 # Execute task assignment
                 return self._assign_task_handler(
                     context,
                     agent=agent_id.strip(),
-                    task=task_desc.strip()
+                    task=task_desc.strip(),
+                    assigned_at=assigned_at
                 )
             
-            # Execute tasks in parallel
-            with concurrent.futures.ThreadPoolExecutor(max_workers=len(task_list)) as executor:
-                # Submit all tasks
-                future_to_task = {
-                    executor.submit(execute_task, task): task 
-                    for task in task_list
-                }
-                
-                # Collect results
-                for future in concurrent.futures.as_completed(future_to_task, timeout=timeout):
-                    task = future_to_task[future]
-                    try:
-                        result = future.result()
-                        results[task] = result
-                        
-                        if fail_fast and result.get('error'):
-                            failed = True
-                            executor.shutdown(wait=False)
-                            break
-                    except Exception as e:
-                        results[task] = {'error': True, 'message': str(e)}
-                        if fail_fast:
-                            failed = True
-                            executor.shutdown(wait=False)
-                            break
-            
+            # Run the async core: one gather/wait_for pair instead of a
+            # fresh waiter per future in an as_completed poll loop
+            coro = self._parallel_handler_async(
+                execute_task, task_list, timeout, fail_fast
+            )
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                results, failed = asyncio.run(coro)
+            else:
+                # Sync call from async code: run on a worker thread so the
+                # caller's loop never hosts a nested run
+                results, failed = self._get_executor().submit(
+                    asyncio.run, coro
+                ).result()
+
+
             return {
                 'type': 'parallel_execution',
                 'tasks': task_list,
@@ -705,7 +781,7 @@ class EnhancedAgentSquad:
                 'message': f"Executed {len(results)}/{len(task_list)} tasks in parallel"
             }
             
-        except concurrent.futures.TimeoutError:
+        except (asyncio.TimeoutError, FuturesTimeoutError):
             return {
                 'error': True,
                 'message': f"Parallel execution timed out after {timeout} seconds"
@@ -715,9 +791,56 @@ class EnhancedAgentSquad:
                 'error': True,
                 'message': f"Failed to execute tasks in parallel: {str(e)}"
             }
-    
+
+    async def _parallel_handler_async(self, execute_task, task_list: List[str],
+                                      timeout: int, fail_fast: bool):
+        """Run execute_task over task_list concurrently.
+
+        Workers run on the default executor via asyncio.to_thread; results
+        come back keyed by task string, plus a fail_fast flag.
+        """
+        results = {}
+        failed = False
+
+        if fail_fast:
+            # Early-exit path: observe completions as they land and cancel
+            # everything still pending on the first error
+            async def run_one(task_str):
+                try:
+                    return task_str, await asyncio.to_thread(execute_task, task_str)
+                except Exception as e:
+                    return task_str, {'error': True, 'message': str(e)}
+
+            pending = [asyncio.ensure_future(run_one(t)) for t in task_list]
+            try:
+                for fut in asyncio.as_completed(pending, timeout=timeout):
+                    task, result = await fut
+                    results[task] = result
+                    if result.get('error'):
+                        failed = True
+                        break
+            finally:
+                for p in pending:
+                    p.cancel()
+            return results, failed
+
+        # Common path: one gather behind one wait_for, a single
+        # synchronization primitive for the whole batch
+        completed = await asyncio.wait_for(
+            asyncio.gather(
+                *(asyncio.to_thread(execute_task, t) for t in task_list),
+                return_exceptions=True
+            ),
+            timeout=timeout
+        )
+        for task, result in zip(task_list, completed):
+            if isinstance(result, BaseException):
+                results[task] = {'error': True, 'message': str(result)}
+            else:
+                results[task] = result
+        return results, failed
+
     def _save_context_state(self, session_id: str):
         """Helper to save context state"""
         state_file = f"context_{session_id}.json"
-        with open(state_file, 'w') as f:
-            json.dump(self.current_context, f, indent=2)
+        _atomic_write(state_file, _json_dumps(self.current_context))
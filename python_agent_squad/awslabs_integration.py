@@ -3,6 +3,8 @@ AWSLabs Agent-Squad Integration for Jump Codes
 This file properly integrates the jump code system with AWSLabs' agent-squad library
 """
 
+from types import MappingProxyType
+
 # First, let's create a configuration that properly imports from agent-squad
 try:
     # Try to import from the actual AWSLabs agent-squad library
@@ -16,41 +18,24 @@ except ImportError:
         print("Warning: Using crewai as fallback. Install agent-squad for full AWSLabs integration:")
         print("pip install agent-squad")
     except ImportError:
-        # Use mock classes if neither is available
+        # Use mock classes if neither is available; they live in their own
+        # module so successful imports never load them
+        from _mock_agent_squad import Agent, Task, Crew
         AGENT_SQUAD_AVAILABLE = False
         print("Warning: Neither agent-squad nor crewai found. Using mock implementation.")
-        
-        class Agent:
-            def __init__(self, role, goal, backstory, tools=None, verbose=True, allow_delegation=False):
-                self.role = role
-                self.goal = goal
-                self.backstory = backstory
-                self.tools = tools or []
-                self.verbose = verbose
-        
-        class Task:
-            def __init__(self, description, agent, expected_output):
-                self.description = description
-                self.agent = agent
-                self.expected_output = expected_output
-        
-        class Crew:
-            def __init__(self, agents, tasks, verbose=True, process="sequential"):
-                self.agents = agents
-                self.tasks = tasks
-                self.verbose = verbose
-                self.process = process
-            
-            def kickoff(self):
-                return "Mock execution completed"
+
+# The status never changes after import, so build it once and hand out a
+# read-only view instead of allocating a fresh dict per poll
+_STATUS = MappingProxyType({
+    "agent_squad_available": AGENT_SQUAD_AVAILABLE,
+    "implementation": "AWSLabs agent-squad" if AGENT_SQUAD_AVAILABLE else "Mock/Fallback",
+    "import_source": "agent_squad" if AGENT_SQUAD_AVAILABLE else "mock"
+})
+
 
 def get_agent_squad_status():
     """Return the current agent-squad integration status"""
-    return {
-        "agent_squad_available": AGENT_SQUAD_AVAILABLE,
-        "implementation": "AWSLabs agent-squad" if AGENT_SQUAD_AVAILABLE else "Mock/Fallback",
-        "import_source": "agent_squad" if AGENT_SQUAD_AVAILABLE else "mock"
-    }
+    return _STATUS
 
 # Export the classes for use in jump code integration
 __all__ = ['Agent', 'Task', 'Crew', 'AGENT_SQUAD_AVAILABLE', 'get_agent_squad_status']
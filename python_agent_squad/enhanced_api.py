@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Enhanced API - Unified REST/WebSocket API for both jump code systems
+Exposes the classic registry (jump_codes.py) and the enhanced async
+processor (enhanced_jump_codes.py) over HTTP and WebSocket
+"""
+
+import os
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import orjson
+from datetime import datetime
+from typing import List
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+from enhanced_jump_codes import (
+    execute,
+    execute_async,
+    list_jump_codes,
+    has_jump_code,
+    get_execution_stats,
+    get_recent_history,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+app = FastAPI(
+    title="Enhanced Jump Code API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+# Compress large JSON payloads (/jump/batch, /jump/codes); small
+# responses skip compression entirely via the size threshold
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Add CORS middleware last so it wraps compression
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Classic jump code system, created lazily so worker boot (and /health)
+# doesn't pay the full squad import/construction cost up front
+_SQUAD = None
+_MIDDLEWARE = None
+_SQUAD_LOCK = threading.Lock()
+
+
+def _squad():
+    """Return the lazily constructed classic squad"""
+    global _SQUAD, _MIDDLEWARE
+    # Double-checked: the startup warm-up runs in an executor and can
+    # race the first request; without the lock both build a squad and
+    # the later assignment silently replaces the earlier instance
+    if _SQUAD is None:
+        with _SQUAD_LOCK:
+            if _SQUAD is None:
+                from agent_squad_jump_integration import EnhancedAgentSquad
+                from advanced_jump_codes import JumpCodeMiddleware
+
+                squad = EnhancedAgentSquad()
+                # Middleware first so _MIDDLEWARE is never None once
+                # _SQUAD is visible
+                _MIDDLEWARE = JumpCodeMiddleware(squad)
+                _SQUAD = squad
+    return _SQUAD
+
+
+def _jump_middleware():
+    """Return the middleware bound to the lazily constructed squad"""
+    _squad()
+    return _MIDDLEWARE
+
+
+@app.on_event("startup")
+async def warm_squad():
+    """Warm the squad once per worker, off the request path"""
+    asyncio.get_running_loop().run_in_executor(_POOL, _squad)
+
+# FastAPI only auto-threadpools plain `def` endpoints; async handlers must
+# offload blocking jump-code execution themselves to keep the loop free
+_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="jumpapi")
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking callable on the shared pool without pinning the loop"""
+    return await asyncio.get_running_loop().run_in_executor(_POOL, func, *args)
+
+
+@lru_cache(maxsize=1)
+def _cached_codes_set() -> frozenset:
+    """Enhanced code names without the @ prefix, built once per registration.
+
+    Call _cached_codes_set.cache_clear() after registering new handlers.
+    """
+    return frozenset(c.lstrip("@") for c in list_jump_codes())
+
+
+# Shared key tuple for /jump/batch rows; dict(zip(...)) over interned keys
+# builds each row without re-hashing literal keys per result
+_BATCH_ROW_KEYS = ("code", "success", "data", "error", "execution_time")
+
+
+class JumpRequest(BaseModel):
+    code: str
+    implementation: str = "classic"
+
+
+class BatchRequest(BaseModel):
+    codes: List[str]
+    mode: str = "sequential"
+
+
+class AgentRequest(BaseModel):
+    role: str
+    goal: str = ""
+    backstory: str = ""
+
+
+@app.get("/health")
+async def health_check():
+    """Health check covering both jump code systems"""
+    enhanced_status = (
+        await _run_blocking(execute, "@status")
+        if has_jump_code("@status") else None
+    )
+
+    return {
+        "status": "healthy",
+        "service": "enhanced-jump-code-api",
+        "classic_codes": len(_squad().jump_registry.codes),
+        "enhanced_codes": len(list_jump_codes()),
+        "enhanced_status": enhanced_status.data if enhanced_status else None,
+        "timestamp": datetime.now()
+    }
+
+
+@app.post("/jump/execute")
+async def execute_jump_code(request: JumpRequest):
+    """Execute a single jump code on the chosen implementation"""
+    if request.implementation == "enhanced":
+        result = await _run_blocking(execute, request.code)
+        return {
+            "code": request.code,
+            "implementation": "enhanced",
+            "success": result.success,
+            "data": result.data,
+            "error": result.error,
+            "execution_time": result.execution_time,
+            # orjson serializes datetime natively
+            "timestamp": result.timestamp
+        }
+
+    result = await _run_blocking(_squad().process_jump_code, request.code)
+    return {
+        "code": request.code,
+        "implementation": "classic",
+        "success": not result.get('error', False),
+        "result": result
+    }
+
+
+@app.post("/jump/batch")
+async def execute_batch(request: BatchRequest):
+    """Execute a batch of jump codes sequentially or in parallel"""
+    if request.mode == "strict_sequential":
+        # Each code completes before the next starts (ordering side-effects)
+        results = [await execute_async(code) for code in request.codes]
+    else:
+        # Independent codes pipeline on the event loop instead of
+        # blocking the worker for the whole batch
+        results = await asyncio.gather(
+            *[execute_async(code) for code in request.codes]
+        )
+
+    # Large nested payload: serialize directly, skipping response validation
+    return ORJSONResponse(content={
+        "mode": request.mode,
+        "results": [
+            dict(zip(_BATCH_ROW_KEYS,
+                     (code, r.success, r.data, r.error, r.execution_time)))
+            for code, r in zip(request.codes, results)
+        ],
+        "total": len(results),
+        "successful": sum(1 for r in results if r.success)
+    })
+
+
+@app.get("/jump/codes")
+async def list_codes(implementation: str = "both"):
+    """List registered jump codes for one or both implementations"""
+    response = {}
+
+    if implementation in ("classic", "both"):
+        response["classic"] = [f"@{code}" for code in _squad().jump_registry.codes]
+    if implementation in ("enhanced", "both"):
+        response["enhanced"] = list_jump_codes()
+
+    return response
+
+
+@app.get("/jump/history")
+async def get_history(limit: int = 50):
+    """Return recent enhanced execution history with success rate"""
+    total, successes = get_execution_stats()
+    success_rate = successes / total * 100 if total else 0
+
+    return ORJSONResponse(content={
+        "total": total,
+        "success_rate": success_rate,
+        "history": get_recent_history(limit)
+    })
+
+
+@app.post("/agents")
+async def create_agent(agent: AgentRequest):
+    """Create an agent through the classic jump code system"""
+    # Single join instead of repeated string reallocation; escape commas
+    # so values survive the downstream key=value parse
+    parts = [f"role={agent.role.replace(',', ';')}"]
+    if agent.goal:
+        parts.append(f"goal={agent.goal.replace(',', ';')}")
+    if agent.backstory:
+        parts.append(f"backstory={agent.backstory.replace(',', ';')}")
+    params = ",".join(parts)
+
+    result = await _run_blocking(_squad().process_jump_code, f"@create_agent:{params}")
+    return {"success": not result.get('error', False), "result": result}
+
+
+@app.get("/agents")
+async def list_agents():
+    """List agents registered with the classic squad"""
+    result = await _run_blocking(_squad().process_jump_code, "@list_agents")
+    return {"success": not result.get('error', False), "result": result}
+
+
+@app.get("/demo")
+async def run_demo():
+    """Run a small demo across both implementations, streamed as NDJSON"""
+    classic_tests = [
+        "@status",
+        "@create_agent:role=demo_agent,goal=demonstrate the API",
+        "@list_agents"
+    ]
+    enhanced_tests = ["@status", "@history"]
+
+    async def gen():
+        # Emit each result as soon as its jump code finishes instead of
+        # holding the client until the whole batch is done
+        for code in classic_tests:
+            result = await _run_blocking(_squad().process_jump_code, code)
+            yield orjson.dumps({
+                "implementation": "classic",
+                "code": code,
+                "result": result
+            }) + b"\n"
+
+        for code in enhanced_tests:
+            if code.lstrip("@") in _cached_codes_set():
+                result = await _run_blocking(execute, code)
+                yield orjson.dumps({
+                    "implementation": "enhanced",
+                    "code": code,
+                    "success": result.success,
+                    "data": result.data
+                }) + b"\n"
+
+        yield orjson.dumps({"demo": "complete", "timestamp": datetime.now()}) + b"\n"
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
+
+async def _ws_execute(out_queue: asyncio.Queue, request: dict):
+    """Handle an 'execute' frame"""
+    code = request.get("code", "")
+    if request.get("implementation") == "enhanced":
+        result = await _run_blocking(execute, code)
+        payload = {
+            "type": "result",
+            "code": code,
+            "success": result.success,
+            "data": result.data,
+            "error": result.error,
+            "execution_time": result.execution_time
+        }
+    else:
+        result = await _run_blocking(_squad().process_jump_code, code)
+        payload = {
+            "type": "result",
+            "code": code,
+            "success": not result.get('error', False),
+            "result": result
+        }
+    out_queue.put_nowait(payload)
+
+
+async def _ws_list(out_queue: asyncio.Queue, request: dict):
+    """Handle a 'list' frame"""
+    out_queue.put_nowait({
+        "type": "codes",
+        "classic": [f"@{code}" for code in _squad().jump_registry.codes],
+        "enhanced": list_jump_codes()
+    })
+
+
+# One dict lookup per frame; new message types just add an entry
+_WS_HANDLERS = {
+    "execute": _ws_execute,
+    "list": _ws_list,
+}
+
+
+@app.websocket("/ws/jump")
+async def websocket_jump_codes(websocket: WebSocket):
+    """Execute jump codes interactively over a WebSocket"""
+    await websocket.accept()
+    logger.info("WebSocket client connected")
+
+    # Outbound queue decouples handler execution from socket sends and
+    # lets the writer merge bursts of small results into one frame
+    out_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+
+    async def writer():
+        while True:
+            batch = [await out_queue.get()]
+            while not out_queue.empty() and len(batch) < 32:
+                batch.append(out_queue.get_nowait())
+            # Binary frames skip the UTF-8 decode/re-encode round trip
+            await websocket.send_bytes(orjson.dumps(batch))
+
+    writer_task = asyncio.create_task(writer())
+
+    try:
+        while True:
+            data = await websocket.receive_text()
+            request = orjson.loads(data)
+
+            msg_type = request.get("type")
+            handler = _WS_HANDLERS.get(msg_type)
+            if handler:
+                await handler(out_queue, request)
+            else:
+                out_queue.put_nowait({
+                    "type": "error",
+                    "message": f"Unknown message type: {msg_type}"
+                })
+
+    except WebSocketDisconnect:
+        logger.info("WebSocket client disconnected")
+    except Exception as e:
+        logger.error(f"WebSocket error: {e}")
+        await websocket.send_json({"type": "error", "message": str(e)})
+    finally:
+        writer_task.cancel()
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "enhanced_api:app",
+        host="0.0.0.0",
+        port=int(os.getenv("JUMP_API_PORT", 8000)),
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        workers=2 * os.cpu_count() + 1
+    )
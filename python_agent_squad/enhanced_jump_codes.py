@@ -0,0 +1,577 @@
+#!/usr/bin/env python3
+"""
+Enhanced Jump Codes - Async jump code system for Claude Agent Squad
+Supports async handlers, parallel execution, and reusable macros
+"""
+
+import asyncio
+import os
+import re
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, List, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Jump code grammar, compiled once: @name or @name:params
+_PARSE_RE = re.compile(r'@(\w+)(?::(.+))?$')
+
+# key=value tokenizer: one C-level scan over the whole params string
+# instead of a split-on-comma/split-on-equals Python loop
+_KV_RE = re.compile(r'(\w+)\s*=\s*([^,]+)')
+
+# Specialized @parallel grammar: each task is agent_N:description, the
+# whole list scanned in one finditer pass instead of split(';')+split(':')
+_TASKS_RE = re.compile(r'(agent_\d+):([^;,]+)')
+_TIMEOUT_RE = re.compile(r'timeout\s*=\s*(\d+)')
+
+# The same handful of param keys recurs across virtually every jump code;
+# interned keys hash once and compare by identity in dict lookups
+_INTERNED = {k: sys.intern(k) for k in (
+    "role", "goal", "agent", "task", "tasks", "timeout",
+    "name", "verbose", "criteria", "target",
+)}
+
+
+@lru_cache(maxsize=1024)
+def _parse_code_cached(code_string: str):
+    """Parse a jump code into (name, param item tuple).
+
+    The same code strings recur constantly, so results are memoized;
+    immutable pieces are cached and callers build their own params dict.
+    """
+    match = _PARSE_RE.match(code_string.strip())
+    if not match:
+        raise ValueError(f"Invalid jump code format: {code_string}")
+
+    name = match.group(1)
+    params_str = match.group(2) or ""
+
+    params: Dict[str, Any] = {}
+    if params_str:
+        for m in _KV_RE.finditer(params_str):
+            key = m.group(1)
+            params[_INTERNED.get(key) or sys.intern(key)] = m.group(2).strip()
+        if not params:
+            # No key=value pairs at all: treat the payload as one value
+            params = {'value': params_str.strip()}
+
+    return name, tuple(params.items())
+
+
+# One pool shared by every processor, sized for the host (or pinned via
+# JUMP_THREAD_POOL) instead of a hardcoded 10 workers per instance
+_DEFAULT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("JUMP_THREAD_POOL",
+                              min(32, (os.cpu_count() or 1) + 4))),
+    thread_name_prefix="jumpcode"
+)
+
+
+@dataclass(slots=True)
+class JumpCodeResult:
+    """Result of a single jump code execution"""
+    success: bool
+    data: Any = None
+    error: Optional[str] = None
+    execution_time: float = 0.0
+    timestamp: Optional[datetime] = None
+
+
+class EnhancedJumpCodeRegistry:
+    """Registry mapping jump code patterns to handlers"""
+
+    def __init__(self):
+        self.codes: Dict[str, Callable] = {}
+        self.aliases: Dict[str, str] = {}
+        self.macros: Dict[str, List[str]] = {}
+        # Macro commands resolved to (handler, param items, raw) at
+        # registration so runs skip parse and dispatch entirely
+        self.macros_compiled: Dict[str, List[tuple]] = {}
+        # Dispatch table: literal patterns resolve with one dict lookup;
+        # only genuine regexes fall through to the compiled list. Entries
+        # are (handler, is_coro) so dispatch never re-inspects the handler
+        self._exact: Dict[str, tuple] = {}
+        self._regex: List[tuple] = []
+        # Specialized parsers keyed by '@name': codes with a fixed param
+        # shape skip the generic k=v loop for a single-pass scan
+        self.pre_parsers: Dict[str, Callable[[str], Dict[str, Any]]] = {}
+        # Staging list for deferred_registration; None means live mode
+        self._pending: Optional[List[tuple]] = None
+
+    def register(self, pattern: str, handler: Callable,
+                 aliases: Optional[List[str]] = None,
+                 sync_inline: bool = True,
+                 literal: Optional[bool] = None):
+        """Register a handler for a jump code pattern.
+
+        sync_inline=True (the default) runs cheap sync handlers directly
+        on the event loop; pass False — or decorate with @blocking — for
+        I/O-bound handlers that must go through the thread pool. Callers
+        that already know whether the pattern is a plain literal can pass
+        `literal` to skip the inspection here.
+        """
+        if self._pending is not None:
+            self._pending.append((pattern, handler, aliases, sync_inline,
+                                  literal))
+            return
+        if not sync_inline:
+            handler._sync_inline = False
+        if pattern in self.codes:
+            logger.warning(f"Overriding existing jump code: {pattern}")
+        self.codes[pattern] = handler
+
+        if literal is None:
+            literal = re.escape(pattern) == pattern
+        # Answered once here instead of on every dispatch
+        is_coro = asyncio.iscoroutinefunction(handler)
+        if literal:
+            self._exact[pattern] = (handler, is_coro)
+        else:
+            self._regex.append((re.compile(pattern), handler, is_coro))
+
+        for alias in aliases or []:
+            if alias in self.aliases:
+                logger.warning(f"Overriding existing alias: {alias}")
+            self.aliases[alias] = pattern
+
+    @contextmanager
+    def deferred_registration(self):
+        """Stage register() calls and flush them in one batch at exit.
+
+        Inside the block, register() appends to a staging list; exit
+        classifies every pattern and applies the dispatch tables with
+        bulk updates instead of per-code dict writes (duplicate-override
+        warnings are skipped in batch mode).
+        """
+        self._pending = []
+        try:
+            yield self
+        finally:
+            pending, self._pending = self._pending, None
+            codes: Dict[str, Callable] = {}
+            exact: Dict[str, tuple] = {}
+            regex: List[tuple] = []
+            aliases: Dict[str, str] = {}
+            for pattern, handler, als, sync_inline, literal in pending:
+                if not sync_inline:
+                    handler._sync_inline = False
+                codes[pattern] = handler
+                if literal is None:
+                    literal = re.escape(pattern) == pattern
+                is_coro = asyncio.iscoroutinefunction(handler)
+                if literal:
+                    exact[pattern] = (handler, is_coro)
+                else:
+                    regex.append((re.compile(pattern), handler, is_coro))
+                for alias in als or []:
+                    aliases[alias] = pattern
+            self.codes.update(codes)
+            self._exact.update(exact)
+            self._regex.extend(regex)
+            self.aliases.update(aliases)
+
+    def register_pre_parser(self, code: str,
+                            parser: Callable[[str], Dict[str, Any]]):
+        """Install a specialized parameter parser for one code.
+
+        The parser receives the raw params string (everything after the
+        first ':') and returns the params dict; returning None falls back
+        to the generic key=value parse.
+        """
+        self.pre_parsers[sys.intern(code)] = parser
+
+    def register_macro(self, name: str, commands: List[str],
+                       description: str = ""):
+        """Register a named sequence of jump codes"""
+        self.macros[name] = commands
+        self.macros_compiled[name] = [self._precompile(cmd) for cmd in commands]
+        logger.info(f"Macro '{name}' registered with {len(commands)} commands")
+
+    def _precompile(self, command: str) -> tuple:
+        """Resolve one macro command to (dispatch entry, param items, raw).
+
+        Unparseable commands and codes registered after the macro keep a
+        None entry and fall back to the regular execution path.
+        """
+        try:
+            code_name, param_items = _parse_code_cached(command)
+        except ValueError:
+            return None, None, command
+        return self.get_entry(f"@{code_name}"), param_items, command
+
+    def get_handler(self, code: str) -> Optional[Callable]:
+        """Find the handler whose pattern matches the given code"""
+        entry = self.get_entry(code)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, code: str) -> Optional[tuple]:
+        """Resolve a code to its (handler, is_coro) dispatch entry"""
+        # Resolve aliases first
+        if code in self.aliases:
+            code = self.aliases[code]
+
+        entry = self._exact.get(code)
+        if entry is not None:
+            return entry
+
+        for compiled, handler, is_coro in self._regex:
+            if compiled.match(code):
+                return handler, is_coro
+        return None
+
+
+class EnhancedJumpCodeProcessor:
+    """Async processor that parses and executes enhanced jump codes"""
+
+    def __init__(self, registry: Optional[EnhancedJumpCodeRegistry] = None,
+                 executor: Optional[ThreadPoolExecutor] = None):
+        self.registry = registry or EnhancedJumpCodeRegistry()
+        self.executor = executor or _DEFAULT_EXECUTOR
+        self.context: Dict[str, Any] = {}
+        # Bounded history with a running success counter so stats stay O(1);
+        # benchmarks can flip history_enabled off to skip recording entirely
+        self.history_enabled = True
+        self.execution_history: deque = deque(
+            maxlen=int(os.getenv("JUMP_HISTORY_MAX", 10_000))
+        )
+        self._success_count = 0
+        # Persistent loop for the sync entry points, started on first use;
+        # avoids asyncio.run's per-call loop/executor/signal setup
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background loop, starting its daemon thread lazily"""
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    # run_in_executor reuses the registry's pool instead of
+                    # spawning a default executor per loop
+                    loop.set_default_executor(self.executor)
+                    thread = threading.Thread(
+                        target=loop.run_forever,
+                        name='jumpcode-loop',
+                        daemon=True
+                    )
+                    thread.start()
+                    self._loop_thread = thread
+                    self._loop = loop
+        return self._loop
+
+    def shutdown(self):
+        """Stop the background loop and release its thread"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            # Not closed: close() would also shut down the shared executor
+            # the loop adopted via set_default_executor
+            self._loop = None
+            self._loop_thread = None
+
+    def parse_jump_code(self, code_string: str) -> Dict[str, Any]:
+        """Parse jump code format: @name:param1=value1,param2=value2"""
+        if self.registry.pre_parsers:
+            head, _, params_str = code_string.strip().partition(':')
+            pre = self.registry.pre_parsers.get(head)
+            if pre is not None:
+                params = pre(params_str)
+                if params is not None:
+                    return {'name': head[1:], 'params': params,
+                            'raw': code_string}
+
+        name, param_items = _parse_code_cached(code_string)
+        # Fresh params dict per call; handlers are free to mutate it
+        return {'name': name, 'params': dict(param_items), 'raw': code_string}
+
+    async def execute_async(self, code_string: str) -> JumpCodeResult:
+        """Execute a single jump code asynchronously"""
+        try:
+            parsed = self.parse_jump_code(code_string)
+        except ValueError as e:
+            logger.error(f"Error executing jump code '{code_string}': {e}")
+            result = JumpCodeResult(success=False, error=str(e))
+            if self.history_enabled:
+                result.timestamp = datetime.now()
+                self._record_execution({
+                    'code': code_string,
+                    'success': False,
+                    'error': result.error,
+                    'execution_time': 0.0,
+                    'timestamp': result.timestamp.isoformat()
+                })
+            return result
+
+        entry = self.registry.get_entry(f"@{parsed['name']}")
+        return await self._execute_parsed(entry, parsed['params'], code_string)
+
+    async def _execute_parsed(self, entry: Optional[tuple],
+                              params: Dict[str, Any],
+                              raw: str) -> JumpCodeResult:
+        """Run an already-resolved jump code: dispatch, timing, history"""
+        # perf_counter is one monotonic C call; datetime.now() allocates
+        # an object per read and is only needed for the history record
+        start = time.perf_counter()
+        try:
+            if entry is None:
+                raise ValueError(f"Unknown jump code: {raw}")
+            handler, is_coro = entry
+
+            if is_coro:
+                data = await handler(params, self.context)
+            elif getattr(handler, '_sync_inline', True):
+                # Sub-microsecond handlers would pay more for the thread
+                # hand-off than for the work itself
+                data = handler(params, self.context)
+            else:
+                loop = asyncio.get_event_loop()
+                data = await loop.run_in_executor(
+                    self.executor, handler, params, self.context
+                )
+
+            result = JumpCodeResult(
+                success=True,
+                data=data,
+                execution_time=time.perf_counter() - start
+            )
+
+        except Exception as e:
+            logger.error(f"Error executing jump code '{raw}': {e}")
+            result = JumpCodeResult(
+                success=False,
+                error=str(e),
+                execution_time=time.perf_counter() - start
+            )
+
+        if self.history_enabled:
+            result.timestamp = datetime.now()
+            self._record_execution({
+                'code': raw,
+                'success': result.success,
+                'error': result.error,
+                'execution_time': result.execution_time,
+                'timestamp': result.timestamp.isoformat()
+            })
+
+        return result
+
+    def _record_execution(self, entry: Dict[str, Any]):
+        """Append to history, keeping the success counter in sync"""
+        history = self.execution_history
+        if len(history) == history.maxlen and history[0]['success']:
+            self._success_count -= 1
+        history.append(entry)
+        if entry['success']:
+            self._success_count += 1
+
+    def get_execution_stats(self) -> tuple:
+        """Return (total, successes) without scanning the history"""
+        return len(self.execution_history), self._success_count
+
+    def execute(self, code_string: str) -> JumpCodeResult:
+        """Execute a single jump code synchronously"""
+        return asyncio.run_coroutine_threadsafe(
+            self.execute_async(code_string), self._ensure_loop()
+        ).result()
+
+    async def execute_parallel_async(self, codes: List[str]) -> List[JumpCodeResult]:
+        """Execute multiple jump codes concurrently.
+
+        Parsing and handler resolution happen once up front; the gather
+        only schedules already-resolved work.
+        """
+        items = []
+        for code in codes:
+            try:
+                parsed = self.parse_jump_code(code)
+            except ValueError:
+                # Unparseable codes go through the regular path, which
+                # reports the format error
+                items.append(None)
+                continue
+            entry = self.registry.get_entry(f"@{parsed['name']}")
+            items.append((entry, parsed['params'], code))
+
+        return await asyncio.gather(*[
+            self.execute_async(code) if item is None
+            else self._execute_parsed(*item)
+            for item, code in zip(items, codes)
+        ])
+
+    def execute_parallel(self, codes: List[str]) -> List[JumpCodeResult]:
+        """Execute multiple jump codes concurrently (sync wrapper)"""
+        return asyncio.run_coroutine_threadsafe(
+            self.execute_parallel_async(codes), self._ensure_loop()
+        ).result()
+
+    async def execute_macro(self, name: str) -> List[JumpCodeResult]:
+        """Execute a registered macro sequentially.
+
+        Commands were parsed and dispatched at registration; each run just
+        calls the cached handlers.
+        """
+        if name not in self.registry.macros:
+            raise ValueError(f"Unknown macro: {name}")
+
+        results = []
+        for entry, param_items, raw in self.registry.macros_compiled[name]:
+            if entry is None:
+                # Unknown at registration time; resolve through the
+                # regular path, which also reports parse errors
+                results.append(await self.execute_async(raw))
+            else:
+                results.append(
+                    await self._execute_parsed(entry, dict(param_items), raw)
+                )
+        return results
+
+
+# Default registry and processor shared by the module-level API
+_registry = EnhancedJumpCodeRegistry()
+_processor = EnhancedJumpCodeProcessor(_registry)
+
+
+def blocking(func: Callable) -> Callable:
+    """Mark a sync handler as blocking so it runs on the thread pool"""
+    func._sync_inline = False
+    return func
+
+
+def jump_code(pattern: str, aliases: Optional[List[str]] = None):
+    """Decorator for registering enhanced jump code handlers"""
+    # Classify the pattern once at decoration time; literal codes land
+    # straight in the exact-match dispatch dict
+    is_literal = re.escape(pattern) == pattern
+
+    def decorator(func):
+        _registry.register(pattern, func, aliases, literal=is_literal)
+        return func
+    return decorator
+
+
+# Built-in handlers
+@jump_code(r'@status', aliases=[r'@s'])
+def _status_handler(params: Dict[str, Any], context: Dict[str, Any]):
+    """Show processor status"""
+    return {
+        'type': 'status',
+        'registered_codes': len(_registry.codes),
+        'registered_macros': len(_registry.macros),
+        'history_size': len(_processor.execution_history),
+        'context_keys': list(context.keys()),
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+@jump_code(r'@context')
+def _context_handler(params: Dict[str, Any], context: Dict[str, Any]):
+    """Show or update the shared context"""
+    if params:
+        context.update(params)
+    return {'type': 'context', 'context': dict(context)}
+
+
+@jump_code(r'@history')
+def _history_handler(params: Dict[str, Any], context: Dict[str, Any]):
+    """Show recent execution history"""
+    limit = int(params.get('limit', 10))
+    return {
+        'type': 'history',
+        'entries': list(_processor.execution_history)[-limit:],
+        'total': len(_processor.execution_history)
+    }
+
+
+def parallel_pre_parser(params_str: str) -> Optional[Dict[str, Any]]:
+    """Fast single-pass parse of @parallel:tasks=agent_N:...;agent_M:...
+
+    Returns structured params — tasks as (agent, task) pairs and timeout
+    already an int — in one finditer scan, instead of the generic k=v
+    loop followed by a re-split on ';' and ':' in the handler. Falls back
+    to the generic parse (None) when no agent_N:task pairs are present.
+    """
+    tasks = [(m.group(1), m.group(2).strip())
+             for m in _TASKS_RE.finditer(params_str)]
+    if not tasks:
+        return None
+    params: Dict[str, Any] = {'tasks': tasks}
+    timeout = _TIMEOUT_RE.search(params_str)
+    if timeout:
+        params['timeout'] = int(timeout.group(1))
+    return params
+
+
+_registry.register_pre_parser('@parallel', parallel_pre_parser)
+
+
+# Default macros
+_registry.register_macro(
+    'debug_all',
+    ['@status', '@history:limit=5', '@context'],
+    description='Show full processor state'
+)
+
+
+# Module-level convenience API
+def execute(code_string: str) -> JumpCodeResult:
+    """Execute a jump code on the default processor"""
+    return _processor.execute(code_string)
+
+
+async def execute_async(code_string: str) -> JumpCodeResult:
+    """Execute a jump code on the default processor from a running loop"""
+    return await _processor.execute_async(code_string)
+
+
+def execute_parallel(codes: List[str]) -> List[JumpCodeResult]:
+    """Execute jump codes in parallel on the default processor.
+
+    Runs on the persistent background loop; callers already inside a
+    running loop should await execute_parallel_async instead of blocking.
+    """
+    return _processor.execute_parallel(codes)
+
+
+async def execute_parallel_async(codes: List[str]) -> List[JumpCodeResult]:
+    """Execute jump codes in parallel from a running loop"""
+    return await _processor.execute_parallel_async(codes)
+
+
+def list_jump_codes() -> List[str]:
+    """List all registered jump code patterns"""
+    return list(_registry.codes.keys())
+
+
+def has_jump_code(name: str) -> bool:
+    """O(1) membership test on the default registry, with or without '@'"""
+    if not name.startswith('@'):
+        name = f"@{name}"
+    return name in _registry.codes or name in _registry.aliases
+
+
+def get_execution_history() -> List[Dict[str, Any]]:
+    """Return the default processor's execution history"""
+    return list(_processor.execution_history)
+
+
+def get_execution_stats() -> tuple:
+    """Return (total, successes) for the default processor in O(1)"""
+    return _processor.get_execution_stats()
+
+
+def get_recent_history(limit: int) -> List[Dict[str, Any]]:
+    """Return the newest `limit` history entries without copying the rest"""
+    tail = list(islice(reversed(_processor.execution_history), limit))
+    tail.reverse()
+    return tail
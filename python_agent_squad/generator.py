@@ -1,8 +1,15 @@
+import asyncio
 import os
-import json
 import hashlib
+
+import aiofiles
+import aiofiles.os
+import orjson
+from collections import OrderedDict
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import List
 import openai
@@ -12,20 +19,28 @@ load_dotenv()
 
 app = FastAPI(title="Agent Spec Generator", version="1.0.0")
 
-# Add CORS middleware
+# Specs are multi-KB of prompt/markdown text; gzip halves them on the wire
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Add CORS middleware; max_age lets browsers cache the preflight for a day
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 CACHE_DIR = os.getenv("CACHE_DIR", "../agent_cache")
 os.makedirs(CACHE_DIR, exist_ok=True)
 
-# Initialize OpenAI client
-client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Async client: the worker coroutine yields during the HTTPS round-trip
+# instead of blocking the whole event loop on GPT-4
+client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+# Cap concurrent outbound LLM calls per worker
+_LLM_SEMAPHORE = asyncio.Semaphore(int(os.getenv("LLM_CONCURRENCY", "16")))
 
 class Spec(BaseModel):
     name: str
@@ -37,59 +52,105 @@ class GeneratedSpec(BaseModel):
     system_prompt: str
     agent_md: str
 
-async def call_llm(prompt: str) -> str:
-    """Call OpenAI API to generate agent specifications"""
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are an expert prompt generator following semantic engineering principles."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2000
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"LLM call failed: {str(e)}")
+# Fields every LLM payload must carry; checked with one C-level subset test
+_REQUIRED = frozenset(("persona", "system_prompt", "agent_md"))
 
-@app.post("/generate_agent", response_model=GeneratedSpec)
-async def gen_agent(spec: Spec):
-    """Generate agent specifications with caching"""
-    # Create cache key from spec
-    spec_dict = spec.dict()
-    key = hashlib.sha256(json.dumps(spec_dict, sort_keys=True).encode()).hexdigest()
-    cache_path = os.path.join(CACHE_DIR, f"{spec.name}_{key}.json")
-    
-    # Check cache first
-    if os.path.exists(cache_path):
-        with open(cache_path, 'r') as f:
-            return GeneratedSpec(**json.load(f))
-    
-    # Generate prompt following semantic principles
-    prompt = f"""
+# Built once at import; per-request work is a single .format() call
+_PROMPT_TEMPLATE = """
     You are an expert prompt generator applying semantic engineering principles.
-    
+
     Generate specifications for an AI agent with these requirements:
-    - Agent Name: {spec.name}
-    - Role: {spec.role_description}
-    - Available Tools: {', '.join(spec.tools)}
-    
+    - Agent Name: {name}
+    - Role: {role}
+    - Available Tools: {tools}
+
     Apply these principles:
     1. **Lexical Density**: Use precise, information-dense wording
     2. **Semantic Gravity**: Balance context-dependence with abstraction
     3. **Semantic Prosody**: Maintain appropriate tone and connotation
-    
+
     Produce a JSON response with exactly these fields:
     {{
         "persona": "A 2-3 sentence character description capturing the agent's expertise and approach",
         "system_prompt": "A comprehensive system prompt defining the agent's behavior, constraints, and tool usage patterns",
         "agent_md": "A markdown specification document describing the agent's capabilities, workflows, and best practices"
     }}
-    
+
     Ensure the system_prompt explicitly references available tools and defines clear decision boundaries.
     """
+
+# In-process LRU of serialized spec bodies: repeat hits skip the file
+# read, JSON decode, and Pydantic validation entirely and go straight
+# out as a raw JSON response
+_MEM_CACHE: "OrderedDict[str, bytes]" = OrderedDict()
+_MEM_CACHE_MAX = 512
+
+
+def _remember(key: str, body: bytes) -> Response:
+    """Insert into the memory cache, evicting the oldest entry past cap"""
+    _MEM_CACHE[key] = body
+    _MEM_CACHE.move_to_end(key)
+    if len(_MEM_CACHE) > _MEM_CACHE_MAX:
+        _MEM_CACHE.popitem(last=False)
+    return Response(content=body, media_type="application/json")
+
+async def call_llm(prompt: str) -> str:
+    """Call OpenAI API to generate agent specifications"""
+    try:
+        async with _LLM_SEMAPHORE:
+            stream = await client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": "You are an expert prompt generator following semantic engineering principles."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=2000,
+                stream=True
+            )
+            # Accumulate deltas as they arrive rather than holding the
+            # connection for one monolithic response
+            chunks = []
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    chunks.append(chunk.choices[0].delta.content)
+        return "".join(chunks)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"LLM call failed: {str(e)}")
+
+@app.post("/generate_agent", response_model=GeneratedSpec)
+async def gen_agent(spec: Spec):
+    """Generate agent specifications with caching"""
+    # Create cache key from spec; blake2b is faster than sha256 on these
+    # short inputs and nothing here needs a cryptographic digest
+    spec_dict = spec.dict()
+    # orjson emits bytes directly, skipping the str→bytes hop
+    key = hashlib.blake2b(
+        orjson.dumps(spec_dict, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{spec.name}_{key}.json")
+
+    # Check the memory cache, then the disk cache; hits skip Pydantic
+    # re-serialization and return the stored bytes directly
+    cached = _MEM_CACHE.get(key)
+    if cached is not None:
+        _MEM_CACHE.move_to_end(key)
+        return Response(content=cached, media_type="application/json")
+
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            body = f.read()
+        orjson.loads(body)  # reject a corrupt cache file, serve raw otherwise
+        return _remember(key, body)
     
+    # Generate prompt following semantic principles
+    prompt = _PROMPT_TEMPLATE.format(
+        name=spec.name,
+        role=spec.role_description,
+        tools=', '.join(spec.tools),
+    )
+
+
     # Get LLM response
     llm_response = await call_llm(prompt)
     
@@ -101,20 +162,32 @@ async def gen_agent(spec: Spec):
         if llm_response.endswith("```"):
             llm_response = llm_response[:-3]
         
-        payload = json.loads(llm_response.strip())
+        # orjson tolerates surrounding whitespace, no strip needed
+        payload = orjson.loads(llm_response)
         
         # Validate required fields
-        if not all(key in payload for key in ["persona", "system_prompt", "agent_md"]):
+        if not _REQUIRED.issubset(payload):
             raise ValueError("Missing required fields in LLM response")
-            
+
+        # Full field validation before anything is cached; a payload
+        # with the right keys but wrong types must never be stored and
+        # replayed from cache
+        GeneratedSpec(**payload)
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Invalid JSON from LLM: {str(e)}")
     
-    # Cache the result
-    with open(cache_path, 'w') as f:
-        json.dump(payload, f, indent=2)
-    
-    return GeneratedSpec(**payload)
+    # Cache the result: compact single-line JSON, written atomically so a
+    # crash mid-write can't leave a torn file for later hits
+    # Async writeback: the loop keeps serving other requests while the
+    # cache entry lands on disk, still atomically via temp file + rename
+    body = orjson.dumps(payload)
+    tmp_path = cache_path + ".tmp"
+    async with aiofiles.open(tmp_path, 'wb') as f:
+        await f.write(body)
+    await aiofiles.os.replace(tmp_path, cache_path)
+
+    return _remember(key, body)
 
 @app.get("/health")
 async def health_check():
@@ -124,4 +197,18 @@ async def health_check():
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("GENERATOR_PORT", 8001))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop + httptools cut per-request loop/protocol overhead; fall back
+    # to the default asyncio loop on platforms without uvloop wheels
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop=loop_impl,
+        http="httptools",
+        workers=int(os.getenv("GEN_WORKERS", 1)),
+    )
@@ -6,7 +6,8 @@ Jump Code CLI - Interactive command-line interface for Claude Agent Squad
 import os
 import sys
 import json
-import yaml
+import time
+from collections import deque
 from typing import Dict, Any
 from agent_squad_jump_integration import EnhancedAgentSquad
 from advanced_jump_codes import JumpCodeMiddleware
@@ -27,18 +28,67 @@ class JumpCodeCLI:
         self.squad = EnhancedAgentSquad()
         self.middleware = JumpCodeMiddleware(self.squad)
         self.running = True
-        self.command_history = []
         self._load_config()
+        # Bounded history: O(1) append with automatic eviction instead of
+        # a list that grows for the life of the session
+        self.command_history = deque(
+            maxlen=self.config.get('history_size', 1000)
+        )
+        # O(1) dispatch for /-commands; extend by adding an entry
+        self._slash_handlers = {
+            '/exit': self._do_exit,
+            '/history': self._do_history,
+        }
         
     def _load_config(self):
-        """Load configuration from YAML"""
+        """Load configuration from YAML, via a JSON cache keyed by mtime"""
+        path = 'jump_codes_config.yaml'
         try:
-            with open('jump_codes_config.yaml', 'r') as f:
-                self.config = yaml.safe_load(f)
-                logger.info("Loaded jump codes configuration")
+            yaml_mtime = os.stat(path).st_mtime
         except FileNotFoundError:
             logger.warning("No jump_codes_config.yaml found, using defaults")
             self.config = {'jump_codes': {'enabled': True, 'prefix': '@'}}
+            return
+
+        # json.load is several times faster than a YAML parse, so reuse
+        # the cached parse until the YAML changes; the cache sits beside
+        # its source file, so distinct configs can't collide
+        cache_path = f"{path}.cache.json"
+        try:
+            if os.stat(cache_path).st_mtime >= yaml_mtime:
+                with open(cache_path, 'r') as f:
+                    self.config = json.load(f)
+                logger.info("Loaded jump codes configuration (cached)")
+                return
+        except (OSError, ValueError):
+            pass  # missing or corrupt cache: fall through to the parse
+
+        # Deferred import: cached startups and missing configs never pay
+        # for loading PyYAML at all
+        import yaml
+        try:
+            # LibYAML's C parser is ~10x faster than the pure-Python default
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        if not getattr(yaml, '__with_libyaml__', False):
+            logger.warning(
+                "PyYAML built without LibYAML; install libyaml-dev and "
+                "reinstall PyYAML for faster config parsing"
+            )
+        with open(path, 'r') as f:
+            self.config = yaml.load(f, Loader=SafeLoader)
+        logger.info("Loaded jump codes configuration")
+
+        # Refresh the cache atomically so a crash can't leave a torn file
+        tmp_path = cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.config, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            logger.debug("Could not write config cache", exc_info=True)
     
     def display_welcome(self):
         """Display welcome message"""
@@ -100,9 +150,8 @@ class JumpCodeCLI:
         
         elif result_type == 'sequence_execution':
             lines = [f"🔄 Sequence Execution: {result.get('success_count')}/{result.get('total_count')} successful"]
-            for res in result.get('results', []):
-                status = "✓" if res['success'] else "✗"
-                lines.append(f"  {status} {res['code']}")
+            # Status lines were prebuilt alongside the success tally
+            lines.extend(f"  {line}" for line in result.get('lines', ()))
             return "\n".join(lines)
         
         elif result_type == 'macro_executed':
@@ -117,6 +166,18 @@ class JumpCodeCLI:
             # Generic formatting
             return f"✅ {result.get('message', json.dumps(result, indent=2))}"
     
+    def _do_exit(self):
+        """Handle /exit"""
+        self.running = False
+        print("👋 Goodbye!")
+
+    def _do_history(self):
+        """Handle /history"""
+        print("\n📜 Command History:")
+        for i, entry in enumerate(list(self.command_history)[-10:], 1):
+            stamp = datetime.fromtimestamp(entry['timestamp']).strftime('%H:%M:%S')
+            print(f"  {i}. [{stamp}] {entry['command']}")
+
     def process_command(self, command: str):
         """Process a single command"""
         command = command.strip()
@@ -124,28 +185,23 @@ class JumpCodeCLI:
         if not command:
             return
         
-        # Add to history
+        # Add to history; one C-level clock read per command, formatted
+        # only when /history actually displays it
         self.command_history.append({
             'command': command,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         })
         
         # Check for special commands
-        if command == '/exit':
-            self.running = False
-            print("👋 Goodbye!")
-            return
-        
-        elif command == '/history':
-            print("\n📜 Command History:")
-            for i, entry in enumerate(self.command_history[-10:], 1):
-                print(f"  {i}. [{entry['timestamp'].split('T')[1].split('.')[0]}] {entry['command']}")
+        handler = self._slash_handlers.get(command)
+        if handler:
+            handler()
             return
-        
-        elif command.startswith('/'):
+
+        if command.startswith('/'):
             print(f"❓ Unknown command: {command}")
             return
-        
+
         # Process through middleware
         try:
             result = self.middleware.process_input(command)
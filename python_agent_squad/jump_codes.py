@@ -1,12 +1,85 @@
 # jump_codes.py
 from typing import Dict, Callable, Any, Optional, List
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: validation of code names at registration and
+# the @code:params grammar matched on every parsed command
+_CODE_NAME_RE = re.compile(r'^[a-zA-Z_]\w*$')
+_PARSE_RE = re.compile(r'^(\w+)(?::(.+))?$')
+
+# Single-pass tokenizer over the params string: key=value pairs and bare
+# flags fall out of one finditer scan instead of split(',') + split('=')
+_TOKEN_RE = re.compile(r'(?P<key>\w+)\s*=\s*(?P<val>[^,]+)|(?P<flag>\w+)')
+
+
+def _coerce(value: str):
+    """Coerce a parameter value to bool/int/float, else return it as-is.
+
+    The first character routes to the one conversion that can apply, so
+    plain string values pay a single slice-and-compare instead of the
+    old lower()/isdigit()/replace() probe chain.
+    """
+    s = value.strip()
+    c = s[:1]
+    if c in 'tTfF':
+        low = s.lower()
+        if low == 'true':
+            return True
+        if low == 'false':
+            return False
+        return s
+    if c == '-' or c.isdigit():
+        try:
+            return int(s)
+        except ValueError:
+            try:
+                return float(s)
+            except ValueError:
+                return s
+    return s
+
+
+@lru_cache(maxsize=512)
+def _parse_cached(code_string: str):
+    """Parse a code string into (code, parameter item tuple).
+
+    Tests and interactive sessions replay the same strings constantly;
+    memoizing turns the repeat parses into one dict probe. The params
+    are returned as an immutable tuple so the cache entry can't be
+    mutated — callers build their own dict.
+    """
+    # Remove @ prefix if present
+    if code_string.startswith('@'):
+        code_string = code_string[1:]
+
+    match = _PARSE_RE.match(code_string)
+
+    if not match:
+        raise ValueError(f"Invalid jump code format: {code_string}")
+
+    code = match.group(1)
+    params_str = match.group(2) or ""
+
+    parameters = {}
+    if params_str:
+        # One scan tokenizes pairs and flags together
+        for m in _TOKEN_RE.finditer(params_str):
+            key = m.group('key')
+            if key is None:
+                # Flag parameter without value
+                parameters[m.group('flag')] = True
+                continue
+
+            parameters[key] = _coerce(m.group('val'))
+
+    return code, tuple(parameters.items())
+
 @dataclass
 class JumpCode:
     """Represents a single jump code command"""
@@ -29,6 +102,15 @@ class JumpCodeRegistry:
     def __init__(self):
         self.codes: Dict[str, JumpCode] = {}
         self.aliases: Dict[str, str] = {}
+        # Codes and aliases merged into one table so dispatch resolves
+        # either with a single dict probe
+        self._resolve: Dict[str, JumpCode] = {}
+        # Dense id table for execute_by_id: hot loops resolve a name to
+        # its int once, then dispatch by list index with no hashing
+        self._id: Dict[str, int] = {}
+        self._table: List[Optional[JumpCode]] = []
+        # Sorted view rebuilt lazily; registration is rare next to @list
+        self._sorted_codes: Optional[List] = None
         self._initialize_core_codes()
     
     def _initialize_core_codes(self):
@@ -63,22 +145,48 @@ class JumpCodeRegistry:
     def register(self, jump_code: JumpCode):
         """Register a new jump code"""
         # Validate code format
-        if not re.match(r'^[a-zA-Z_]\w*$', jump_code.code):
+        if not _CODE_NAME_RE.match(jump_code.code):
             raise ValueError(f"Invalid jump code format: {jump_code.code}")
         
         # Check for duplicates
         if jump_code.code in self.codes:
-            logger.warning(f"Overriding existing jump code: {jump_code.code}")
+            logger.warning("Overriding existing jump code: %s", jump_code.code)
         
         self.codes[jump_code.code] = jump_code
-        
+        self._resolve[jump_code.code] = jump_code
+        # Re-registration keeps the code's slot so cached ids stay valid
+        slot = self._id.get(jump_code.code)
+        if slot is None:
+            slot = len(self._table)
+            self._table.append(jump_code)
+            self._id[jump_code.code] = slot
+        else:
+            self._table[slot] = jump_code
+        # Snapshot the defaults once; execute rebuilds from the tuple
+        # instead of double-unpacking two dicts per dispatch
+        jump_code._parameters_tuple = tuple(jump_code.parameters.items())
+        # Lowercased once here so @help filtering is a single substring
+        # test per code; the NUL keeps code and description from
+        # matching across their boundary
+        jump_code._search_blob = (
+            f"{jump_code.code}\0{jump_code.description}".lower()
+        )
+        self._sorted_codes = None
+
         # Register aliases
         if jump_code.aliases:
             for alias in jump_code.aliases:
                 if alias in self.aliases:
-                    logger.warning(f"Overriding existing alias: {alias}")
+                    logger.warning("Overriding existing alias: %s", alias)
                 self.aliases[alias] = jump_code.code
+                self._resolve[alias] = jump_code
+                self._id[alias] = slot
     
+    def register_many(self, jump_codes: List[JumpCode]):
+        """Register a batch of jump codes in one pass"""
+        for jump_code in jump_codes:
+            self.register(jump_code)
+
     def unregister(self, code: str):
         """Unregister a jump code"""
         if code in self.codes:
@@ -88,8 +196,16 @@ class JumpCodeRegistry:
                 for alias in jump_code.aliases:
                     if alias in self.aliases:
                         del self.aliases[alias]
-            # Remove code
+                    self._resolve.pop(alias, None)
+                    self._id.pop(alias, None)
+            # Remove code; the id slot is tombstoned, not compacted, so
+            # other codes' cached ids stay valid
             del self.codes[code]
+            self._resolve.pop(code, None)
+            slot = self._id.pop(code, None)
+            if slot is not None:
+                self._table[slot] = None
+            self._sorted_codes = None
             return True
         return False
     
@@ -103,71 +219,77 @@ class JumpCodeRegistry:
             code_name = parsed['code']
             params = parsed['parameters']
             
-            # Resolve aliases
-            if code_name in self.aliases:
-                code_name = self.aliases[code_name]
-            
-            # Check if code exists
-            if code_name not in self.codes:
+            # One probe resolves codes and aliases alike
+            jump_code = self._resolve.get(code_name)
+            if jump_code is None:
                 raise ValueError(f"Unknown jump code: {code_name}")
             
-            jump_code = self.codes[code_name]
-            
             # Validate context requirements
             if jump_code.context_required:
                 self._validate_context(jump_code.context_required, context)
             
-            # Merge parameters with defaults
-            final_params = {**jump_code.parameters, **params}
+            # Merge parameters with defaults; with no overrides (the
+            # common case) the call's ** unpack does the only copy
+            if params:
+                final_params = dict(jump_code._parameters_tuple)
+                final_params.update(params)
+            else:
+                final_params = jump_code.parameters
             
-            # Execute handler
-            logger.info(f"Executing jump code: {code_name} with params: {final_params}")
+            # Execute handler; build the log string only when INFO is on
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Executing jump code: %s with params: %s",
+                            code_name, final_params)
             return jump_code.handler(context=context, **final_params)
             
         except Exception as e:
             logger.error(f"Error executing jump code '{code_string}': {e}")
             raise
     
+    def code_id(self, code_name: str) -> int:
+        """Return the integer dispatch id for a code or alias.
+
+        Resolve once outside a hot loop, then drive execute_by_id with
+        the int so repeated dispatch skips string hashing entirely.
+        """
+        try:
+            return self._id[code_name]
+        except KeyError:
+            raise ValueError(f"Unknown jump code: {code_name}") from None
+
+    def execute_by_id(self, code_id: int,
+                      params: Dict[str, Any] = None,
+                      context: Dict[str, Any] = None):
+        """Execute a jump code by its dispatch id (see code_id).
+
+        Takes pre-parsed params, so the @code:k=v parse is also skipped;
+        semantics otherwise match execute."""
+        if context is None:
+            context = {}
+
+        jump_code = self._table[code_id]
+        if jump_code is None:
+            raise ValueError(f"Unknown jump code id: {code_id}")
+
+        if jump_code.context_required:
+            self._validate_context(jump_code.context_required, context)
+
+        if params:
+            final_params = dict(jump_code._parameters_tuple)
+            final_params.update(params)
+        else:
+            final_params = jump_code.parameters
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executing jump code: %s with params: %s",
+                        jump_code.code, final_params)
+        return jump_code.handler(context=context, **final_params)
+
     def _parse_jump_code(self, code_string: str) -> Dict[str, Any]:
         """Parse jump code format: @code:param1=value1,param2=value2"""
-        # Remove @ prefix if present
-        if code_string.startswith('@'):
-            code_string = code_string[1:]
-        
-        # Pattern for parsing jump codes
-        pattern = r'^(\w+)(?::(.+))?$'
-        match = re.match(pattern, code_string)
-        
-        if not match:
-            raise ValueError(f"Invalid jump code format: {code_string}")
-        
-        code = match.group(1)
-        params_str = match.group(2) or ""
-        
-        parameters = {}
-        if params_str:
-            # Parse key=value pairs
-            for param in params_str.split(','):
-                param = param.strip()
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Try to parse value types
-                    if value.lower() in ('true', 'false'):
-                        parameters[key] = value.lower() == 'true'
-                    elif value.isdigit():
-                        parameters[key] = int(value)
-                    elif value.replace('.', '', 1).isdigit():
-                        parameters[key] = float(value)
-                    else:
-                        parameters[key] = value
-                else:
-                    # Flag parameter without value
-                    parameters[param] = True
-        
-        return {'code': code, 'parameters': parameters}
+        code, param_items = _parse_cached(code_string)
+        # Fresh dict per call; the cached tuple stays immutable
+        return {'code': code, 'parameters': dict(param_items)}
     
     def _validate_context(self, required: List[str], context: Dict[str, Any]):
         """Validate that required context keys are present"""
@@ -189,11 +311,12 @@ class JumpCodeRegistry:
     def _help_handler(self, context: Dict[str, Any], filter: str = "", **kwargs):
         """Show help for jump codes"""
         codes_info = []
-        
+        flt = filter.lower() if filter else ""
+
         for code_name, jump_code in self.codes.items():
-            if filter and filter.lower() not in code_name.lower() and filter.lower() not in jump_code.description.lower():
+            if flt and flt not in jump_code._search_blob:
                 continue
-            
+
             codes_info.append({
                 'code': code_name,
                 'description': jump_code.description,
@@ -211,8 +334,10 @@ class JumpCodeRegistry:
     def _list_handler(self, context: Dict[str, Any], **kwargs):
         """List all registered jump codes"""
         codes_list = []
-        
-        for code_name, jump_code in sorted(self.codes.items()):
+
+        if self._sorted_codes is None:
+            self._sorted_codes = sorted(self.codes.items())
+        for code_name, jump_code in self._sorted_codes:
             code_info = f"@{code_name}"
             if jump_code.aliases:
                 code_info += f" (aliases: {', '.join(jump_code.aliases)})"
@@ -1,11 +1,17 @@
+import functools
 import os
-import json
-import httpx
+import string
+import aiofiles
+import aiofiles.os
+import orjson
 import logging
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
 from dotenv import load_dotenv
 import asyncio
 from datetime import datetime
@@ -46,6 +52,64 @@ AGENT_MODELS = {
     "Coder": os.getenv("CODER_MODEL", "claude-3-haiku-20240307")
 }
 
+# The environment doesn't change at runtime, so resolve it once: the
+# generator URL at import, per-agent key/model lookups behind an
+# lru_cache instead of getenv traversals on every agent creation
+_GENERATOR_BASE_URL = f"http://localhost:{os.getenv('GENERATOR_PORT', 8001)}"
+_GENERATOR_URL = f"{_GENERATOR_BASE_URL}/generate_agent"
+
+@functools.lru_cache(maxsize=None)
+def _resolve_api_key(name: str) -> Optional[str]:
+    return os.getenv(f"OPENAI_API_KEY_{name.upper()}",
+                     os.getenv("OPENAI_API_KEY"))
+
+@functools.lru_cache(maxsize=None)
+def _resolve_model(name: str) -> str:
+    return AGENT_MODELS.get(name, "claude-3-sonnet-20240229")
+
+async def _write_file(path: str, data, mode: str = "w",
+                      encoding: Optional[str] = None) -> None:
+    """Write one file via aiofiles; gather these to batch small writes"""
+    async with aiofiles.open(path, mode, encoding=encoding) as f:
+        await f.write(data)
+
+# Fallback spec template, built once; each use only substitutes the
+# name/role/tool-list fields
+_AGENT_MD_TMPL = string.Template("""# $name Agent Specification
+
+## Role
+$role
+
+## Available Tools
+$tools
+
+## Capabilities
+- Expert analysis and execution within domain
+- Tool orchestration for complex workflows
+- Collaborative work with other squad agents
+
+## Best Practices
+1. Always validate inputs before processing
+2. Use appropriate tools for each subtask
+3. Provide clear status updates during execution
+4. Handle errors gracefully with informative messages
+""")
+
+# Shared HTTP client: one pool with keep-alive connections instead of a
+# fresh TCP+TLS handshake per spec-fetch attempt. httpx itself loads
+# lazily so health-check-only invocations skip the import cost.
+_HTTP_CLIENT: Optional["httpx.AsyncClient"] = None
+
+def _get_http_client() -> "httpx.AsyncClient":
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        import httpx
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10)
+        )
+    return _HTTP_CLIENT
+
 # Squad instance using agent_squad library
 squad = AgentSquad()
 
@@ -93,45 +157,49 @@ async def add_agent_with_profile(
     Raises:
         AgentCreationError: If agent creation fails after retries
     """
-    logger.info(f"Creating agent profile for {name}")
-    
-    # Determine API key and model
+    # Fail fast on a missing key before the httpx import, logging or any
+    # other setup happens on this path
     if not api_key:
-        api_key = os.getenv(f"OPENAI_API_KEY_{name.upper()}", os.getenv("OPENAI_API_KEY"))
+        api_key = _resolve_api_key(name)
     if not api_key:
         raise AgentCreationError(f"No API key available for agent {name}")
-    
+
+    import httpx  # deferred with the shared client; only needed here
+
+    logger.info(f"Creating agent profile for {name}")
+
     if not model:
-        model = AGENT_MODELS.get(name, "claude-3-sonnet-20240229")
-    
+        model = _resolve_model(name)
+
     # Fetch or generate spec with retries
     spec = None
-    generator_url = f"http://localhost:{os.getenv('GENERATOR_PORT', 8001)}/generate_agent"
-    
+    generator_url = _GENERATOR_URL
+
+    client = _get_http_client()
     for attempt in range(3):
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info(f"Fetching spec from generator (attempt {attempt + 1}/3)")
-                response = await client.post(
-                    generator_url,
-                    json={"name": name, "role_description": role, "tools": tools}
-                )
-                response.raise_for_status()
-                spec = response.json()
-                
-                # Validate spec structure
-                required_keys = ["persona", "system_prompt", "agent_md"]
-                missing_keys = [k for k in required_keys if k not in spec]
-                if missing_keys:
-                    raise SpecValidationError(f"Missing required spec keys: {missing_keys}")
-                
-                # Validate spec content
-                if not all(isinstance(spec[k], str) and spec[k].strip() for k in required_keys):
-                    raise SpecValidationError("Spec contains empty or invalid values")
-                
-                logger.info(f"Successfully fetched valid spec for {name}")
-                break
-                
+            logger.info(f"Fetching spec from generator (attempt {attempt + 1}/3)")
+            response = await client.post(
+                generator_url,
+                json={"name": name, "role_description": role, "tools": tools}
+            )
+            response.raise_for_status()
+            spec = response.json()
+
+            # Validate spec structure
+            required_keys = ["persona", "system_prompt", "agent_md"]
+            missing_keys = [k for k in required_keys if k not in spec]
+            if missing_keys:
+                raise SpecValidationError(f"Missing required spec keys: {missing_keys}")
+
+            # Validate spec content
+            if not all(isinstance(spec[k], str) and spec[k].strip() for k in required_keys):
+                raise SpecValidationError("Spec contains empty or invalid values")
+
+            logger.info(f"Successfully fetched valid spec for {name}")
+            break
+
+
         except httpx.HTTPError as e:
             logger.warning(f"HTTP error fetching spec (attempt {attempt + 1}): {e}")
             if attempt == 2:
@@ -162,40 +230,27 @@ Core Principles:
 4. Tool Usage: Leverage your tools efficiently to accomplish tasks
 
 Always provide clear, actionable responses that directly address the user's needs.""",
-            "agent_md": f"""# {name} Agent Specification
-
-## Role
-{role}
-
-## Available Tools
-{chr(10).join(f'- {tool}' for tool in tools)}
-
-## Capabilities
-- Expert analysis and execution within domain
-- Tool orchestration for complex workflows
-- Collaborative work with other squad agents
-
-## Best Practices
-1. Always validate inputs before processing
-2. Use appropriate tools for each subtask
-3. Provide clear status updates during execution
-4. Handle errors gracefully with informative messages
-"""
+            "agent_md": _AGENT_MD_TMPL.substitute(
+                name=name,
+                role=role,
+                tools="\n".join(f"- {tool}" for tool in tools)
+            )
         }
     
-    # Create agent directory structure
+    # Create agent directory structure; async I/O keeps the event loop
+    # serving other agents while this one touches disk
     try:
         agent_dir = f"./agents/{name}"
-        os.makedirs(agent_dir, exist_ok=True)
-        os.makedirs(f"{agent_dir}/logs", exist_ok=True)
-        os.makedirs(f"{agent_dir}/cache", exist_ok=True)
-        
-        # Save agent markdown spec
+        await aiofiles.os.makedirs(agent_dir, exist_ok=True)
+        # The subdirectories and both files are independent once the
+        # parent exists; gather batches the burst of small disk
+        # operations instead of awaiting them one syscall at a time
+        await asyncio.gather(
+            aiofiles.os.makedirs(f"{agent_dir}/logs", exist_ok=True),
+            aiofiles.os.makedirs(f"{agent_dir}/cache", exist_ok=True)
+        )
+
         spec_path = f"{agent_dir}/agent.md"
-        with open(spec_path, "w", encoding="utf-8") as f:
-            f.write(spec["agent_md"])
-        
-        # Save full profile as JSON
         profile_path = f"{agent_dir}/profile.json"
         profile_data = {
             "name": name,
@@ -206,9 +261,17 @@ Always provide clear, actionable responses that directly address the user's need
             "system_prompt": spec["system_prompt"],
             "created_at": datetime.now().isoformat()
         }
-        with open(profile_path, "w", encoding="utf-8") as f:
-            json.dump(profile_data, f, indent=2)
-            
+        # orjson serializes in C; binary mode skips the str→bytes hop
+        await asyncio.gather(
+            _write_file(spec_path, spec["agent_md"], encoding="utf-8"),
+            _write_file(
+                profile_path,
+                orjson.dumps(profile_data, option=orjson.OPT_INDENT_2),
+                mode="wb"
+            )
+        )
+
+
     except IOError as e:
         raise AgentCreationError(f"Failed to create agent directory structure: {e}")
     
@@ -260,11 +323,19 @@ async def add_agent(name: str, role: str, tools: List[str]):
     """Legacy function wrapper for backwards compatibility"""
     return await add_agent_with_profile(name, role, tools)
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Release the shared HTTP connection pool"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
 @app.on_event("startup")
 async def startup():
     """Initialize the agent squad on startup"""
     logger.info("Initializing Agent Squad...")
-    
+
     # Set up supervisor
     supervisor = BaseSupAgent("PM", api_key=os.getenv("OPENAI_API_KEY"))
     squad.set_supervisor(supervisor)
@@ -288,16 +359,24 @@ async def startup():
         }
     ]
     
-    for config in agents_config:
-        try:
-            result = await add_agent_with_profile(**config)
-            logger.info(f"Agent creation result: {result}")
-        except AgentCreationError as e:
-            logger.error(f"Failed to create {config['name']} agent: {e}")
+    # Agents are independent, so create them concurrently: startup waits
+    # for the slowest agent instead of the sum of all three. The sync
+    # squad.add_agent call runs atomically on the event loop, so gather's
+    # interleaving never splits it.
+    results = await asyncio.gather(
+        *(add_agent_with_profile(**config) for config in agents_config),
+        return_exceptions=True
+    )
+    for config, result in zip(agents_config, results):
+        if isinstance(result, AgentCreationError):
             # Continue with other agents even if one fails
-        except Exception as e:
-            logger.error(f"Unexpected error creating {config['name']} agent: {e}")
-    
+            logger.error(f"Failed to create {config['name']} agent: {result}")
+        elif isinstance(result, BaseException):
+            logger.error(f"Unexpected error creating {config['name']} agent: {result}")
+        else:
+            logger.info(f"Agent creation result: {result}")
+
+
     logger.info(f"Squad initialized with {len(squad.agents)} agents")
 
 @app.post("/run_squad")
@@ -352,7 +431,7 @@ async def health_check():
         "service": "agent-squad-api",
         "agents": len(squad.agents),
         "supervisor": squad.supervisor.name if squad.supervisor else "Not configured",
-        "generator_url": f"http://localhost:{os.getenv('GENERATOR_PORT', 8001)}",
+        "generator_url": _GENERATOR_BASE_URL,
         "uptime": datetime.now().isoformat()
     }
 
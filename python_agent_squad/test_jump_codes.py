@@ -3,7 +3,12 @@
 Test script for Jump Codes system in Claude Agent Squad
 """
 
+import io
 import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from jump_codes import JumpCodeRegistry, JumpCode
 from agent_squad_jump_integration import EnhancedAgentSquad
 from advanced_jump_codes import SequentialJumpCodes, JumpCodeMacros, JumpCodeMiddleware
@@ -15,6 +20,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _shared_squad() -> EnhancedAgentSquad:
+    """One squad reused by tests that don't assert exact agent counts.
+
+    Construction registers every handler and compiles the dispatch
+    tables; sharing it amortizes that setup instead of repeating it per
+    test. Count-sensitive tests build their own instance.
+    """
+    return EnhancedAgentSquad()
+
+
 def test_basic_jump_codes():
     """Test basic jump code functionality"""
     print("\n=== Testing Basic Jump Codes ===")
@@ -128,8 +144,8 @@ def test_error_handling():
     """Test error handling"""
     print("\n=== Testing Error Handling ===")
     
-    squad = EnhancedAgentSquad()
-    
+    squad = _shared_squad()
+
     # Test invalid jump code
     result = squad.process_jump_code("@invalid_code")
     print(f"Invalid code result: {result}")
@@ -151,7 +167,7 @@ def test_middleware():
     """Test jump code middleware"""
     print("\n=== Testing Middleware ===")
     
-    squad = EnhancedAgentSquad()
+    squad = _shared_squad()
     middleware = JumpCodeMiddleware(squad)
     
     # Test direct jump code
@@ -176,8 +192,8 @@ def test_state_management():
     """Test state management jump codes"""
     print("\n=== Testing State Management ===")
     
-    squad = EnhancedAgentSquad()
-    
+    squad = _shared_squad()
+
     # Create some state
     squad.process_jump_code("@create_agent:role=state_test,goal=test state management")
     
@@ -196,12 +212,34 @@ def test_state_management():
     # This is a demonstration - actual restore would need file handling
     print("\n✓ State management codes registered correctly")
 
+class _ThreadLocalStdout:
+    """Stdout stand-in that routes writes to a per-thread buffer.
+
+    Worker threads each get their own StringIO, so parallel tests never
+    interleave lines; threads without a buffer (the main thread) fall
+    through to the real stream.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def set_buffer(self, buf):
+        self._local.buffer = buf
+
+    def write(self, s):
+        return getattr(self._local, 'buffer', self._fallback).write(s)
+
+    def flush(self):
+        getattr(self._local, 'buffer', self._fallback).flush()
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 60)
     print("Testing Claude Agent Squad Jump Codes System")
     print("=" * 60)
-    
+
     tests = [
         test_basic_jump_codes,
         test_agent_squad_integration,
@@ -211,27 +249,51 @@ def run_all_tests():
         test_middleware,
         test_state_management
     ]
-    
+
     failed = []
-    
-    for test in tests:
+
+    def _run_buffered(test):
+        buf = io.StringIO()
+        proxy.set_buffer(buf)
         try:
             test()
+            return buf, None
         except Exception as e:
-            failed.append((test.__name__, str(e)))
             print(f"\n✗ {test.__name__} failed: {e}")
-    
-    print("\n" + "=" * 60)
-    print(f"Test Summary: {len(tests) - len(failed)}/{len(tests)} passed")
-    
+            return buf, str(e)
+
+    # The tests are independent, so they run in a thread pool and their
+    # waits overlap; each test's output lands in its own buffer and is
+    # flushed as one block when it completes
+    real_stdout = sys.stdout
+    proxy = _ThreadLocalStdout(real_stdout)
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+            futures = {ex.submit(_run_buffered, t): t.__name__ for t in tests}
+            for future in as_completed(futures):
+                buf, error = future.result()
+                real_stdout.write(buf.getvalue())
+                if error is not None:
+                    failed.append((futures[future], error))
+    finally:
+        sys.stdout = real_stdout
+
+    # Summary assembled in one buffer and emitted with a single write
+    summary = io.StringIO()
+    summary.write("\n" + "=" * 60 + "\n")
+    summary.write(f"Test Summary: {len(tests) - len(failed)}/{len(tests)} passed\n")
+
     if failed:
-        print("\nFailed tests:")
+        summary.write("\nFailed tests:\n")
         for name, error in failed:
-            print(f"  - {name}: {error}")
+            summary.write(f"  - {name}: {error}\n")
     else:
-        print("\n🎉 All tests passed!")
-    
-    print("=" * 60)
+        summary.write("\n🎉 All tests passed!\n")
+
+    summary.write("=" * 60 + "\n")
+    sys.stdout.write(summary.getvalue())
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     run_all_tests()
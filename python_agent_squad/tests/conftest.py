@@ -1,46 +1,86 @@
 """Pytest configuration and fixtures."""
+import os
+
 import pytest
-import asyncio
 from typing import AsyncGenerator
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from fastapi.testclient import TestClient
 
-# Import the app for testing
-try:
-    from python_agent_squad.main import app
-except ImportError:
-    app = None
-
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def _app():
+    """Import the FastAPI app once per session, only when needed.
+
+    Importing main pulls in FastAPI, Pydantic and the HTTP stack;
+    deferring it here means sessions that never touch the HTTP fixtures
+    skip that cost entirely. Import failures (missing optional deps,
+    unconfigured squad backend) skip the dependent tests instead of
+    breaking collection.
+    """
+    try:
+        from python_agent_squad.main import app
+    except Exception as e:
+        pytest.skip(f"FastAPI app not available: {e}")
+    return app
 
 
 @pytest.fixture
-def test_client():
+def test_client(_app):
     """Create test client for FastAPI app."""
-    if app is None:
-        pytest.skip("FastAPI app not available")
-    return TestClient(app)
+    return TestClient(_app)
 
 
 @pytest.fixture
-async def async_client() -> AsyncGenerator[AsyncClient, None]:
+async def async_client(_app) -> AsyncGenerator[AsyncClient, None]:
     """Create async test client for FastAPI app."""
-    if app is None:
-        pytest.skip("FastAPI app not available")
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    # ASGITransport calls the app in-process; httpx dropped the app=
+    # shim in 0.28
+    async with AsyncClient(
+        transport=ASGITransport(app=_app), base_url="http://test"
+    ) as client:
         yield client
 
 
+@pytest.fixture(scope="session")
+def squad():
+    """One EnhancedAgentSquad for the whole session.
+
+    Handler registration and regex compilation run once; tests that only
+    read squad state share this instance.
+    """
+    from agent_squad_jump_integration import EnhancedAgentSquad
+    return EnhancedAgentSquad()
+
+
 @pytest.fixture
-def mock_env(monkeypatch):
-    """Mock environment variables for testing."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setenv("GENERATOR_PORT", "8001")
-    monkeypatch.setenv("SQUAD_API_PORT", "8000")
-    return monkeypatch
\ No newline at end of file
+def fresh_squad():
+    """A squad with no accumulated agents, for count-sensitive tests"""
+    from agent_squad_jump_integration import EnhancedAgentSquad
+    return EnhancedAgentSquad()
+
+
+_MOCK_ENV = {
+    "OPENAI_API_KEY": "test-key",
+    "GENERATOR_PORT": "8001",
+    "SQUAD_API_PORT": "8000",
+}
+
+
+@pytest.fixture
+def mock_env(request):
+    """Mock environment variables for testing.
+
+    One os.environ.update and one finalizer instead of three
+    monkeypatch.setenv calls each registering its own teardown.
+    """
+    orig = {k: os.environ.get(k) for k in _MOCK_ENV}
+    os.environ.update(_MOCK_ENV)
+
+    def _restore():
+        for k, v in orig.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+    request.addfinalizer(_restore)
\ No newline at end of file
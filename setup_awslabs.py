@@ -4,9 +4,11 @@ Setup script for AWSLabs agent-squad integration
 This script helps configure the jump codes to work with AWSLabs' agent-squad
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
+import tempfile
 
 def check_agent_squad():
     """Check if agent-squad is installed"""
@@ -18,22 +20,32 @@ def check_agent_squad():
 
 def install_agent_squad():
     """Attempt to install agent-squad"""
+    # Already importable? Then there is nothing to spawn
+    if importlib.util.find_spec("agent_squad") is not None:
+        print("\n✅ agent-squad already importable, skipping install")
+        return True
+
     print("\n🔧 Installing AWSLabs agent-squad...")
-    
-    # Try different installation methods
+
+    # Try different installation methods; argument lists with
+    # sys.executable avoid shell splitting and PATH lookup of 'pip'
     methods = [
-        ("pip install agent-squad", "PyPI"),
-        ("pip install git+https://github.com/awslabs/agent-squad.git", "GitHub"),
+        ([sys.executable, "-m", "pip", "install", "agent-squad"], "PyPI"),
+        ([sys.executable, "-m", "pip", "install",
+          "git+https://github.com/awslabs/agent-squad.git"], "GitHub"),
     ]
-    
+
     for cmd, source in methods:
-        print(f"\nTrying to install from {source}: {cmd}")
+        print(f"\nTrying to install from {source}: {' '.join(cmd)}")
         try:
-            subprocess.run(cmd.split(), check=True)
+            # Quiet on success; pip's output only matters when it fails
+            subprocess.run(cmd, check=True, capture_output=True, text=True)
             return True
-        except subprocess.CalledProcessError:
+        except subprocess.CalledProcessError as e:
             print(f"❌ Failed to install from {source}")
-    
+            if e.stderr:
+                print(e.stderr.strip())
+
     return False
 
 def update_imports():
@@ -42,26 +54,32 @@ def update_imports():
     
     print(f"\n📝 Updating imports in {file_path}...")
     
+    old_import = "from crewai import Agent, Task, Crew"
+    new_import = "from agent_squad import Agent, Task, Crew"
+
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
-        # Replace the import statement
-        old_import = "from crewai import Agent, Task, Crew"
-        new_import = "from agent_squad import Agent, Task, Crew"
-        
-        if old_import in content:
-            content = content.replace(old_import, new_import)
-            
-            with open(file_path, 'w') as f:
-                f.write(content)
-            
+        # Stream line by line into a temp file in the same directory and
+        # swap it in with os.replace: constant memory and atomic — a
+        # crash mid-write never leaves a half-rewritten source file
+        found = False
+        with open(file_path, 'r') as src, \
+                tempfile.NamedTemporaryFile(
+                    'w', dir=os.path.dirname(file_path),
+                    delete=False) as dst:
+            for line in src:
+                if old_import in line:
+                    line = line.replace(old_import, new_import)
+                    found = True
+                dst.write(line)
+
+        if found:
+            os.replace(dst.name, file_path)
             print("✅ Import statements updated successfully!")
-            return True
         else:
+            os.unlink(dst.name)
             print("ℹ️  Import statements already updated or using mock implementation")
-            return True
-            
+        return True
+
     except Exception as e:
         print(f"❌ Error updating imports: {e}")
         return False
@@ -70,13 +88,14 @@ def test_integration():
     """Test the integration"""
     print("\n🧪 Testing integration...")
     
+    # sys.path manipulation instead of os.chdir: chdir is process-global
+    # and a failure before the restore would leave the wrong cwd behind
+    added = os.path.abspath('python_agent_squad')
+    sys.path.insert(0, added)
     try:
-        # Change to the correct directory
-        os.chdir('python_agent_squad')
-        
         # Try to import and test
         from awslabs_integration import get_agent_squad_status, Agent, Task, Crew
-        
+
         status = get_agent_squad_status()
         print(f"\n✅ Integration Status:")
         print(f"   - Available: {status['agent_squad_available']}")
@@ -97,7 +116,10 @@ def test_integration():
         print(f"\n❌ Integration test failed: {e}")
         return False
     finally:
-        os.chdir('..')
+        try:
+            sys.path.remove(added)
+        except ValueError:
+            pass
 
 def main():
     """Main setup process"""